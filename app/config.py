@@ -1,14 +1,53 @@
+import os
+from functools import lru_cache
+from typing import Optional
+
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings
 
+
+def default_pool_size() -> int:
+    """Size connection pools after the host's async concurrency (2x CPU + 1)."""
+    return max(10, (os.cpu_count() or 1) * 2 + 1)
+
+
 class Settings(BaseSettings):
     database_url: str
     secret_key: str
     algorithm: str
     access_token_expire_minutes: int
 
+    # Database connection pool
+    db_pool_size: int = Field(default_factory=default_pool_size)
+    db_max_overflow: Optional[int] = None
+    db_pool_recycle: int = 3600  # seconds; retire connections before server/proxy idle limits cut them
+
+    # Redis (optional, caching is disabled when no host is configured)
+    redis_host: Optional[str] = None
+    redis_port: int = 6379
+    redis_db: int = 0
+    redis_password: Optional[str] = None
+    redis_pool_size: int = Field(default_factory=default_pool_size)
+    redis_min_idle_conns: Optional[int] = None
+    redis_socket_timeout: float = 5.0
+    redis_health_check_interval: int = 30
+    redis_cache_ttl: int = 300
+
+    @model_validator(mode="after")
+    def derive_pool_limits(self) -> "Settings":
+        if self.db_max_overflow is None:
+            self.db_max_overflow = 2 * self.db_pool_size
+        if self.redis_min_idle_conns is None:
+            self.redis_min_idle_conns = self.redis_pool_size // 4
+        return self
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse the environment once per process; use get_settings.cache_clear() to reload."""
+    return Settings()
 
+settings = get_settings()
@@ -1,33 +1,15 @@
+from importlib import import_module
+from typing import Any, Callable
+
 from dependency_injector import containers, providers
 from sqlalchemy.orm import Session
 from dependency_injector.wiring import inject, Provide
+import lazy_object_proxy
 
-from .config import settings
+from .config import get_settings
 from .db import SessionLocal
-
-# Repositories
-from .repositories.client_repository import ClientRepository
-from .repositories.invoice_repository import InvoiceRepository
-from .repositories.financial_transaction_repository import FinancialTransactionRepository
-from .repositories.user_repository import UserRepository
-from .repositories.audit_log_repository import AuditLogRepository
-from .repositories.permission_repository import PermissionRepository
-
-# Services
-from .services.client_service import ClientService
-from .services.invoice_service import InvoiceService
-from .services.financial_transaction_service import FinancialTransactionService
-from .services.report_service import ReportService
-from .services.auth_service import AuthService
-from .services.audit_log_service import AuditService
-from .services.permission_service import PermissionService
-
-# Controllers
-from .controllers.client_controller import ClientController
-from .controllers.invoice_controller import InvoiceController
-from .controllers.financial_transaction_controller import FinancialTransactionController
-from .controllers.report_controller import ReportController
-from .controllers.auth_controller import AuthController
+from .utils.redis_config import get_redis
+from .utils.rate_limiter import RateLimiter
 
 # Interfaces
 from .interfaces.repositories.client_repository import IClientRepository
@@ -36,6 +18,7 @@ from .interfaces.repositories.financial_transaction_repository import IFinancial
 from .interfaces.repositories.user_repository import IUserRepository
 from .interfaces.repositories.audit_log_repository import IAuditLogRepository
 from .interfaces.repositories.permission_repository import IPermissionRepository
+from .interfaces.repositories.cache_repository import ICacheRepository
 
 from .interfaces.services.client_service import IClientService
 from .interfaces.services.invoice_service import IInvoiceService
@@ -51,111 +34,234 @@ from .interfaces.controllers.financial_transaction_controller import IFinancialT
 from .interfaces.controllers.report_controller import IReportController
 from .interfaces.controllers.auth_controller import IAuthController
 
+settings = get_settings()
+
+# Concrete implementations are only imported once a provider first builds one (PEP 562),
+# so importing the container doesn't pull in every repository, service and controller.
+_IMPLEMENTATIONS = {
+    # Repositories
+    "ClientRepository": ".repositories.client_repository",
+    "InvoiceRepository": ".repositories.invoice_repository",
+    "FinancialTransactionRepository": ".repositories.financial_transaction_repository",
+    "UserRepository": ".repositories.user_repository",
+    "AuditLogRepository": ".repositories.audit_log_repository",
+    "PermissionRepository": ".repositories.permission_repository",
+    "RedisCacheRepository": ".repositories.redis_cache_repository",
+    "NullCacheRepository": ".repositories.null_cache_repository",
+
+    # Services
+    "ClientService": ".services.client_service",
+    "InvoiceService": ".services.invoice_service",
+    "FinancialTransactionService": ".services.financial_transaction_service",
+    "ReportService": ".services.report_service",
+    "AuthService": ".services.auth_service",
+    "AuditService": ".services.audit_log_service",
+    "PermissionService": ".services.permission_service",
+
+    # Controllers
+    "ClientController": ".controllers.client_controller",
+    "InvoiceController": ".controllers.invoice_controller",
+    "FinancialTransactionController": ".controllers.financial_transaction_controller",
+    "ReportController": ".controllers.report_controller",
+    "AuthController": ".controllers.auth_controller",
+}
+
+def __getattr__(name: str) -> Any:
+    module = _IMPLEMENTATIONS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __package__), name)
+    globals()[name] = value
+    return value
+
+def deferred(name: str) -> Callable[..., Any]:
+    """Factory callable that imports the named implementation on its first call."""
+    def build(*args: Any, **kwargs: Any) -> Any:
+        cls = globals().get(name) or __getattr__(name)
+        return cls(*args, **kwargs)
+    build.__name__ = build.__qualname__ = name
+    return build
+
+def lazy(provider: providers.Provider) -> providers.Callable:
+    """Inject a proxy that only builds the dependency on first attribute access."""
+    return providers.Callable(lazy_object_proxy.Proxy, provider.provider)
+
 class Container(containers.DeclarativeContainer):
     # Configuration
     config = providers.Configuration()
     
-    # Database
-    db = providers.Singleton(SessionLocal)
+    # Database (one session per request context, closed by SessionScopeMiddleware)
+    db = providers.ContextLocalSingleton(SessionLocal)
+
+    # Cache
+    redis = providers.Resource(
+        get_redis,
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        password=settings.redis_password,
+        pool_size=settings.redis_pool_size,
+        socket_timeout=settings.redis_socket_timeout,
+        health_check_interval=settings.redis_health_check_interval
+    )
+
+    # Cache repositories are stateless wrappers around the pooled client: one per namespace.
+    # Without a Redis host they all resolve to the shared no-op repository.
+    cache_backend = providers.Object("redis" if settings.redis_host else "null")
+
+    null_cache: providers.Singleton[ICacheRepository] = providers.Singleton(deferred("NullCacheRepository"))
+
+    client_cache: providers.Selector[ICacheRepository] = providers.Selector(
+        cache_backend,
+        redis=providers.Singleton(
+            deferred("RedisCacheRepository"),
+            redis=redis,
+            namespace="clients",
+            default_ttl=settings.redis_cache_ttl
+        ),
+        null=null_cache
+    )
+
+    permission_cache: providers.Selector[ICacheRepository] = providers.Selector(
+        cache_backend,
+        redis=providers.Singleton(
+            deferred("RedisCacheRepository"),
+            redis=redis,
+            namespace="permissions",
+            default_ttl=settings.redis_cache_ttl
+        ),
+        null=null_cache
+    )
+
+    invoice_cache: providers.Selector[ICacheRepository] = providers.Selector(
+        cache_backend,
+        redis=providers.Singleton(
+            deferred("RedisCacheRepository"),
+            redis=redis,
+            namespace="invoices",
+            default_ttl=settings.redis_cache_ttl
+        ),
+        null=null_cache
+    )
+
+    report_cache: providers.Selector[ICacheRepository] = providers.Selector(
+        cache_backend,
+        redis=providers.Singleton(
+            deferred("RedisCacheRepository"),
+            redis=redis,
+            namespace="reports",
+            default_ttl=settings.redis_cache_ttl
+        ),
+        null=null_cache
+    )
     
     # Repositories
     permission_repository: providers.Factory[IPermissionRepository] = providers.Factory(
-        PermissionRepository,
+        deferred("PermissionRepository"),
         db=db
     )
 
     audit_repository: providers.Factory[IAuditLogRepository] = providers.Factory(
-        AuditLogRepository,
+        deferred("AuditLogRepository"),
         db=db
     )
 
     user_repository: providers.Factory[IUserRepository] = providers.Factory(
-        UserRepository,
+        deferred("UserRepository"),
         db=db
     )
 
     client_repository: providers.Factory[IClientRepository] = providers.Factory(
-        ClientRepository,
+        deferred("ClientRepository"),
         db=db
     )
 
     invoice_repository: providers.Factory[IInvoiceRepository] = providers.Factory(
-        InvoiceRepository,
+        deferred("InvoiceRepository"),
         db=db
     )
 
     transaction_repository: providers.Factory[IFinancialTransactionRepository] = providers.Factory(
-        FinancialTransactionRepository,
+        deferred("FinancialTransactionRepository"),
         db=db
     )
 
     # Services
     permission_service: providers.Factory[IPermissionService] = providers.Factory(
-        PermissionService,
+        deferred("PermissionService"),
         permission_repository=permission_repository
     )
 
     audit_service: providers.Factory[IAuditService] = providers.Factory(
-        AuditService,
+        deferred("AuditService"),
         audit_log_repository=audit_repository
     )
 
     auth_service: providers.Factory[IAuthService] = providers.Factory(
-        AuthService,
+        deferred("AuthService"),
         user_repository=user_repository,
         client_repository=client_repository,
-        audit_service=audit_service
+        audit_service=lazy(audit_service)
     )
 
     client_service: providers.Factory[IClientService] = providers.Factory(
-        ClientService,
+        deferred("ClientService"),
         client_repository=client_repository,
-        audit_service=audit_service
+        audit_service=lazy(audit_service)
     )
 
     invoice_service: providers.Factory[IInvoiceService] = providers.Factory(
-        InvoiceService,
+        deferred("InvoiceService"),
         invoice_repository=invoice_repository,
-        audit_service=audit_service
+        audit_service=lazy(audit_service)
     )
 
     transaction_service: providers.Factory[IFinancialTransactionService] = providers.Factory(
-        FinancialTransactionService,
+        deferred("FinancialTransactionService"),
         transaction_repository=transaction_repository,
-        audit_service=audit_service
+        audit_service=lazy(audit_service)
     )
 
     report_service: providers.Factory[IReportService] = providers.Factory(
-        ReportService,
+        deferred("ReportService"),
         client_repository=client_repository,
         transaction_repository=transaction_repository,
         invoice_repository=invoice_repository
     )
 
+    # In-memory PDF render limits, shared by every request in the process
+    pdf_rate_limiter = providers.Singleton(RateLimiter)
+
     # Controllers
     auth_controller: providers.Factory[IAuthController] = providers.Factory(
-        AuthController,
-        auth_service=auth_service
+        deferred("AuthController"),
+        auth_service=lazy(auth_service),
+        permission_cache=permission_cache,
+        client_cache=client_cache
     )
 
     client_controller: providers.Factory[IClientController] = providers.Factory(
-        ClientController,
-        client_service=client_service
+        deferred("ClientController"),
+        client_service=lazy(client_service),
+        client_cache=client_cache
     )
 
     invoice_controller: providers.Factory[IInvoiceController] = providers.Factory(
-        InvoiceController,
-        invoice_service=invoice_service
+        deferred("InvoiceController"),
+        invoice_service=lazy(invoice_service),
+        invoice_cache=invoice_cache
     )
 
     transaction_controller: providers.Factory[IFinancialTransactionController] = providers.Factory(
-        FinancialTransactionController,
-        transaction_service=transaction_service
+        deferred("FinancialTransactionController"),
+        transaction_service=lazy(transaction_service)
     )
 
     report_controller: providers.Factory[IReportController] = providers.Factory(
-        ReportController,
-        report_service=report_service
+        deferred("ReportController"),
+        report_service=lazy(report_service),
+        report_cache=report_cache,
+        rate_limiter=pdf_rate_limiter
     )
 
     # Add wiring configuration at the class level
@@ -1,27 +1,53 @@
 from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from typing import Dict, Any
 
 from ..interfaces.controllers.auth_controller import IAuthController
 from ..interfaces.services.auth_service import IAuthService
+from ..interfaces.repositories.cache_repository import ICacheRepository
 from ..schemas.request.signup import SignupRequest
 from ..schemas.response.login import LoginResponse
+from ..schemas.response.user_info import UserInfoResponse, PermissionInfo
 from ..schemas.dto.user_dto import UserDTO
 from ..schemas.dto.client_dto import ClientDTO
+from ..utils.http_errors import problem_body, StaticHTTPException
+
+# Error details are built once at import instead of on every failed request
+LOGIN_FAILED_BODY = problem_body({
+    "type": "about:blank",
+    "title": "Authentication failed",
+    "status": 401,
+    "detail": "Incorrect username or password",
+    "instance": "/auth/login"
+})
+
+SIGNUP_FAILED_DETAIL = {
+    "type": "about:blank",
+    "title": "Invalid signup data",
+    "status": 400,
+    "instance": "/auth/signup"
+}
+
+# Keys carry the user's and role's last update, so edits made through the app are a miss;
+# the short TTL bounds staleness from permission rows edited directly in the database
+USERINFO_CACHE_TTL = 30
 
 class AuthController(IAuthController):
     """
     Controller handling authentication-related business logic.
     """
     
-    def __init__(self, auth_service: IAuthService):
+    def __init__(self, auth_service: IAuthService, permission_cache: ICacheRepository, client_cache: ICacheRepository):
         """
-        Initialize AuthController with database session.
+        Initialize AuthController with its service and caches.
         
         Args:
-            db: Database session
+            auth_service: Authentication service
+            permission_cache: Cache for rendered user info and permissions
+            client_cache: Client read cache, cleared when signup creates a client
         """
         self.auth_service = auth_service
+        self.permission_cache = permission_cache
+        self.client_cache = client_cache
 
     async def login(self, form_data: OAuth2PasswordRequestForm) -> LoginResponse:
         """
@@ -42,16 +68,7 @@ class AuthController(IAuthController):
         )
         
         if not result:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail={
-                    "type": "about:blank",
-                    "title": "Authentication failed",
-                    "status": 401,
-                    "detail": "Incorrect username or password",
-                    "instance": "/auth/login"
-                }
-            )
+            raise StaticHTTPException(status.HTTP_401_UNAUTHORIZED, LOGIN_FAILED_BODY)
         
         return result
     
@@ -76,21 +93,17 @@ class AuthController(IAuthController):
                 client_id=None,
             )
 
-            return await self.auth_service.signup_client(client_dto, user_dto)
+            result = await self.auth_service.signup_client(client_dto, user_dto)
+            await self.client_cache.clear()
+            return result
         
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Invalid transaction data",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": "/finance/transactions"
-                }
+                detail={**SIGNUP_FAILED_DETAIL, "detail": str(e)}
             )
 
-    async def get_current_user_info(self, current_user: dict) -> Dict[str, Any]:
+    async def get_current_user_info(self, current_user: dict) -> UserInfoResponse:
         """
         Get current user information in API format.
         
@@ -98,18 +111,24 @@ class AuthController(IAuthController):
             current_user: Current authenticated user
             
         Returns:
-            Dict[str, Any]: Formatted user information
+            UserInfoResponse: Formatted user information
         """
-        return {
-            "id": str(current_user.id),
-            "username": current_user.username,
-            "email": current_user.email,
-            "role": current_user.role.name if current_user.role else None,
-            "permissions": [
-                {
-                    "resource": perm.resource,
-                    "action": perm.action
-                }
+        role_updated_at = getattr(current_user.role, "updated_at", None)
+        cache_key = f"userinfo:{current_user.id}:{current_user.updated_at}:{current_user.role_id}:{role_updated_at}"
+        cached = await self.permission_cache.get(cache_key)
+        if cached is not None:
+            return UserInfoResponse(**cached)
+
+        user_info = UserInfoResponse(
+            id=str(current_user.id),
+            username=current_user.username,
+            email=current_user.email,
+            role=current_user.role_name,
+            # Rows straight from the database, so skip re-validating each permission
+            permissions=tuple(
+                PermissionInfo.model_construct(resource=perm.resource, action=perm.action)
                 for perm in current_user.role.permissions
-            ] if current_user.role else []
-        }
\ No newline at end of file
+            ) if current_user.role else ()
+        )
+        await self.permission_cache.set(cache_key, user_info.model_dump(), ttl=USERINFO_CACHE_TTL)
+        return user_info
\ No newline at end of file
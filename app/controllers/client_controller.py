@@ -1,13 +1,40 @@
 from typing import List
 from uuid import UUID
-from fastapi import HTTPException, status
+from fastapi import status
 
 from ..interfaces.controllers.client_controller import IClientController
 from ..interfaces.services.client_service import IClientService
+from ..interfaces.repositories.cache_repository import ICacheRepository
 from ..schemas.request.client import ClientCreate, ClientUpdate
 from ..schemas.response.client import ClientResponse
 from ..schemas.dto.client_dto import ClientDTO
 from ..entities.user import User
+from ..utils.http_errors import value_error_to_http, problem_body, problem_template, StaticHTTPException
+
+# 403 body encoded once; a denial only encodes its instance
+CLIENT_FORBIDDEN_BODY = problem_template({
+    "type": "about:blank",
+    "title": "Forbidden",
+    "status": 403,
+    "detail": "Access to this client is not allowed"
+})
+
+# Fully static, so sent as pre-encoded bytes
+ADMIN_ONLY_BODY = problem_body({
+    "type": "about:blank",
+    "title": "Forbidden",
+    "status": 403,
+    "detail": "Only administrators can perform this action",
+    "instance": "/clients"
+})
+
+# Client reads are cached briefly; every client write (here and in signup) clears the namespace,
+# the TTL bounds staleness from writes made outside the app
+CLIENT_CACHE_TTL = 30
+
+def _cached_dto(data: dict) -> ClientDTO:
+    """Rebuild a ClientDTO from its cached JSON form."""
+    return ClientDTO(**{**data, "id": UUID(data["id"])})
 
 class ClientController(IClientController):
     """
@@ -15,14 +42,16 @@ class ClientController(IClientController):
     Manages access control and coordinates between routes and services.
     """
     
-    def __init__(self, client_service: IClientService):
+    def __init__(self, client_service: IClientService, client_cache: ICacheRepository):
         """
-        Initialize ClientController with database session.
+        Initialize ClientController with its injected service and cache.
         
         Args:
-            db: Database session
+            client_service: Client service
+            client_cache: Cache for client reads
         """
         self.client_service = client_service
+        self.client_cache = client_cache
 
     def _check_client_access(self, client_id: UUID, current_user: User):
         """
@@ -35,17 +64,8 @@ class ClientController(IClientController):
         Raises:
             HTTPException: If access is denied
         """
-        if current_user.role.name == "client" and str(client_id) != str(current_user.client_id):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={
-                    "type": "about:blank",
-                    "title": "Forbidden",
-                    "status": 403,
-                    "detail": "Access to this client is not allowed",
-                    "instance": f"/clients/{client_id}"
-                }
-            )
+        if current_user.is_client and client_id != current_user.client_id:
+            raise StaticHTTPException(status.HTTP_403_FORBIDDEN, CLIENT_FORBIDDEN_BODY(f"/clients/{client_id}"))
 
     def _check_admin_access(self, current_user: User):
         """
@@ -57,19 +77,11 @@ class ClientController(IClientController):
         Raises:
             HTTPException: If user is not an admin
         """
-        if current_user.role.name != "admin":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={
-                    "type": "about:blank",
-                    "title": "Forbidden",
-                    "status": 403,
-                    "detail": "Only administrators can perform this action",
-                    "instance": "/clients"
-                }
-            )
+        if not current_user.is_admin:
+            raise StaticHTTPException(status.HTTP_403_FORBIDDEN, ADMIN_ONLY_BODY)
 
-    async def create_client(self, client_data: ClientCreate, current_user: User) -> ClientResponse:
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Bad Request", "/clients")
+    async def create_client(self, client_data: ClientCreate, current_user: User) -> ClientDTO:
         """
         Create a new client.
         
@@ -78,47 +90,29 @@ class ClientController(IClientController):
             current_user: Current authenticated user
             
         Returns:
-            ClientResponse: Created client
+            ClientDTO: Created client
             
         Raises:
             HTTPException: If creation fails or permissions not met
         """
-        try:
-            # Convert Request to DTO
-            client_dto = ClientDTO(
-                id = None,
-                name = client_data.name,
-                industry= client_data.industry,
-                contact_email= client_data.contact_email,
-                contact_phone= client_data.contact_phone,
-                address = client_data.address
-            )
+        # Convert Request to DTO
+        client_dto = ClientDTO(
+            id = None,
+            name = client_data.name,
+            industry= client_data.industry,
+            contact_email= client_data.contact_email,
+            contact_phone= client_data.contact_phone,
+            address = client_data.address
+        )
 
-            # Send DTO to service, get DTO back
-            result_dto = await self.client_service.create_client(client_dto, current_user)
+        # Send DTO to service, get DTO back
+        result_dto = await self.client_service.create_client(client_dto, current_user)
+        await self.client_cache.clear()
 
-            # Convert DTO to Response
-            return ClientResponse(
-                id = result_dto.id,
-                name = result_dto.name,
-                industry = result_dto.industry,
-                contact_email = result_dto.contact_email,
-                contact_phone = result_dto.contact_phone,
-                address = result_dto.address
-            )
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Bad Request",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": "/clients"
-                }
-            )
+        return result_dto
 
-    async def get_client(self, client_id: UUID, current_user: User) -> ClientResponse:
+    @value_error_to_http(status.HTTP_404_NOT_FOUND, "Not Found", "/clients/{client_id}")
+    async def get_client(self, client_id: UUID, current_user: User) -> ClientDTO:
         """
         Get a client by ID.
         
@@ -127,7 +121,7 @@ class ClientController(IClientController):
             current_user: Current authenticated user
             
         Returns:
-            ClientResponse: Found client
+            ClientDTO: Found client
             
         Raises:
             HTTPException: If client not found or access denied
@@ -135,30 +129,15 @@ class ClientController(IClientController):
         # Check access before attempting to get client
         self._check_client_access(client_id, current_user)
         
-        try:
-            result_dto = await self.client_service.get_client(client_id)
+        cache_key = f"client:{client_id}"
+        cached = await self.client_cache.get(cache_key)
+        if cached is not None:
+            return _cached_dto(cached)
 
-            # Convert DTO to Response
-            return ClientResponse(
-                id = result_dto.id,
-                name = result_dto.name,
-                industry = result_dto.industry,
-                contact_email = result_dto.contact_email,
-                contact_phone = result_dto.contact_phone,
-                address = result_dto.address
-            )
+        result_dto = await self.client_service.get_client(client_id)
+        await self.client_cache.set(cache_key, result_dto, ttl=CLIENT_CACHE_TTL)
 
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "type": "about:blank",
-                    "title": "Not Found",
-                    "status": 404,
-                    "detail": str(e),
-                    "instance": f"/clients/{client_id}"
-                }
-            )
+        return result_dto
 
     async def get_all_clients(self, skip: int = 0, limit: int = 100, current_user: User = None) -> List[ClientResponse]:
         """
@@ -172,26 +151,29 @@ class ClientController(IClientController):
         Returns:
             List[ClientResponse]: List of clients
         """
-        client_dtos = await self.client_service.get_all_clients(skip, limit)
-        
-        # Filter for client role
-        if current_user.role.name == "client":
-            client_dtos = [c for c in client_dtos if str(c.id) == str(current_user.client_id)]
-            
-        # Convert DTOS to Responses
+        # Client users only ever see their own client
+        client_id = None
+        if current_user.is_client:
+            if current_user.client_id is None:
+                return []
+            client_id = current_user.client_id
+
+        cache_key = f"list:{client_id}:{skip}:{limit}"
+        cached = await self.client_cache.get(cache_key)
+        if cached is not None:
+            client_dtos = [_cached_dto(data) for data in cached]
+        else:
+            client_dtos = await self.client_service.get_all_clients(skip, limit, client_id=client_id)
+            await self.client_cache.set(cache_key, client_dtos, ttl=CLIENT_CACHE_TTL)
+
+        # Convert DTOS to Responses; DTOs are already validated so skip re-validating each row
         return [
-            ClientResponse(
-                id = dto.id,
-                name = dto.name,
-                industry = dto.industry,
-                contact_email = dto.contact_email,
-                contact_phone = dto.contact_phone,
-                address = dto.address
-            )
+            ClientResponse.model_construct(**vars(dto))
             for dto in client_dtos
         ]
 
-    async def update_client(self, client_id: UUID, client_data: ClientUpdate, current_user: User) -> ClientResponse:
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Bad Request", "/clients/{client_id}")
+    async def update_client(self, client_id: UUID, client_data: ClientUpdate, current_user: User) -> ClientDTO:
         """
         Update a client.
         
@@ -201,7 +183,7 @@ class ClientController(IClientController):
             current_user: Current authenticated user
             
         Returns:
-            ClientResponse: Updated client
+            ClientDTO: Updated client
             
         Raises:
             HTTPException: If update fails or access denied
@@ -209,42 +191,23 @@ class ClientController(IClientController):
         # Check access before attempting update
         self._check_client_access(client_id, current_user)
         
-        try:
-            # Convert Request to DTO
-            update_dto = ClientDTO(
-                id = client_id,
-                name = client_data.name,
-                industry = client_data.industry,
-                contact_email = client_data.contact_email,
-                contact_phone = client_data.contact_phone,
-                address = client_data.address
-            )
-
-            # Send DTO to service
-            result_dto = await self.client_service.update_client(update_dto, current_user)
+        # Convert Request to DTO
+        update_dto = ClientDTO(
+            id = client_id,
+            name = client_data.name,
+            industry = client_data.industry,
+            contact_email = client_data.contact_email,
+            contact_phone = client_data.contact_phone,
+            address = client_data.address
+        )
 
-            # Convert DTO to Response
-            return ClientResponse(
-                id = result_dto.id,
-                name = result_dto.name,
-                industry = result_dto.industry,
-                contact_email = result_dto.contact_email,
-                contact_phone = result_dto.contact_phone,
-                address = result_dto.address
-            )
+        # Send DTO to service
+        result_dto = await self.client_service.update_client(update_dto, current_user)
+        await self.client_cache.clear()
 
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Bad Request",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": f"/clients/{client_id}"
-                }
-            )
+        return result_dto
 
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Bad Request", "/clients/{client_id}")
     async def delete_client(self, client_id: UUID, current_user: User) -> None:
         """
         Delete a client.
@@ -262,20 +225,10 @@ class ClientController(IClientController):
         # Check admin access for deletion
         self._check_admin_access(current_user)
         
-        try:
-            await self.client_service.delete_client(client_id, current_user)
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Bad Request",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": f"/clients/{client_id}"
-                }
-            )
+        await self.client_service.delete_client(client_id, current_user)
+        await self.client_cache.clear()
 
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Bad Request", "/clients")
     async def search_clients(self, search_term: str, current_user: User) -> List[ClientResponse]:
         """
         Search clients by name or industry.
@@ -286,30 +239,27 @@ class ClientController(IClientController):
             
         Returns:
             List[ClientResponse]: List of matching clients
+
+        Raises:
+            HTTPException: If the search is invalid
         """
-        try:
-            # Get Clients
-            client_dtos = await self.client_service.search_clients(search_term)
-        
-            # Filter for client role
-            if current_user.role.name == "client":
-                client_dtos = [c for c in client_dtos if str(c.id) == str(current_user.client_id)]
-            
-            # Convert DTOS to Responses
-            return [
-                ClientResponse(
-                    id = dto.id,
-                    name = dto.name,
-                    industry = dto.industry,
-                    contact_email = dto.contact_email,
-                    contact_phone = dto.contact_phone,
-                    address = dto.address
-                )
-                for dto in client_dtos
-            ]
-        
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=str(e)
-            )
\ No newline at end of file
+        # Client users only ever see their own client
+        client_id = None
+        if current_user.is_client:
+            if current_user.client_id is None:
+                return []
+            client_id = current_user.client_id
+
+        cache_key = f"search:{client_id}:{search_term}"
+        cached = await self.client_cache.get(cache_key)
+        if cached is not None:
+            client_dtos = [_cached_dto(data) for data in cached]
+        else:
+            client_dtos = await self.client_service.search_clients(search_term, client_id=client_id)
+            await self.client_cache.set(cache_key, client_dtos, ttl=CLIENT_CACHE_TTL)
+
+        # Convert DTOS to Responses; DTOs are already validated so skip re-validating each row
+        return [
+            ClientResponse.model_construct(**vars(dto))
+            for dto in client_dtos
+        ]
\ No newline at end of file
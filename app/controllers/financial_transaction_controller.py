@@ -1,7 +1,7 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from datetime import date
-from fastapi import HTTPException, status
+from fastapi import status
 
 from ..interfaces.controllers.financial_transaction_controller import IFinancialTransactionController
 from ..interfaces.services.financial_transaction_service import IFinancialTransactionService
@@ -9,6 +9,17 @@ from ..entities.user import User
 from ..schemas.request.financial_transaction import FinancialTransactionCreate, FinancialTransactionUpdate
 from ..schemas.response.financial_transaction import FinancialTransactionResponse
 from ..schemas.dto.transaction_dto import TransactionDTO
+from ..services.errors import NotFoundError
+from ..utils.http_errors import value_error_to_http, problem_template, StaticHTTPException
+from ..utils.ndjson import ndjson_lines
+
+# 403 body encoded once; a denial only encodes its instance
+TRANSACTION_FORBIDDEN_BODY = problem_template({
+    "type": "about:blank",
+    "title": "Access denied",
+    "status": 403,
+    "detail": "You can only access your own transactions"
+})
 
 class FinancialTransactionController(IFinancialTransactionController):
     """
@@ -18,10 +29,10 @@ class FinancialTransactionController(IFinancialTransactionController):
     
     def __init__(self, transaction_service: IFinancialTransactionService):
         """
-        Initialize controller with database session.
+        Initialize controller with its injected service.
 
         Args:
-            db: SQLAlchemy database session
+            transaction_service: Financial transaction service
         """
         self.transaction_service = transaction_service
 
@@ -36,88 +47,40 @@ class FinancialTransactionController(IFinancialTransactionController):
         Raises:
             HTTPException: If access is denied
         """
-        if current_user.role.name == "client" and transaction.client_id != current_user.client_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={
-                    "type": "about:blank",
-                    "title": "Access denied",
-                    "status": 403,
-                    "detail": "You can only access your own transactions",
-                    "instance": f"/finance/transactions/{transaction.id}"
-                }
-            )
+        if current_user.is_client and transaction.client_id != current_user.client_id:
+            raise StaticHTTPException(status.HTTP_403_FORBIDDEN, TRANSACTION_FORBIDDEN_BODY(f"/finance/transactions/{transaction.id}"))
 
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Invalid transaction data", "/finance/transactions")
     async def create_transaction(self, 
                              transaction_data: FinancialTransactionCreate,
-                             current_user: User) -> FinancialTransactionResponse:
+                             current_user: User) -> TransactionDTO:
         """Create a new financial transaction."""
-        try:
-            # Convert Request to DTO
-            transaction_dto = TransactionDTO(
-                id=None,
-                client_id=transaction_data.client_id,
-                transaction_date=transaction_data.transaction_date,
-                amount=transaction_data.amount,
-                category=transaction_data.category,
-                description=transaction_data.description,
-                created_by=current_user.id
-            )
-            
-            # Send DTO to service, get DTO back
-            result_dto = await self.transaction_service.create_transaction(transaction_dto, current_user)
-            
-            # Convert DTO to Response
-            return FinancialTransactionResponse(
-                id=result_dto.id,
-                client_id=result_dto.client_id,
-                transaction_date=result_dto.transaction_date,
-                amount=result_dto.amount,
-                category=result_dto.category,
-                description=result_dto.description,
-                created_by=result_dto.created_by
-            )
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Invalid transaction data",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": "/finance/transactions"
-                }
-            )
+        # Convert Request to DTO
+        transaction_dto = TransactionDTO(
+            id=None,
+            client_id=transaction_data.client_id,
+            transaction_date=transaction_data.transaction_date,
+            amount=transaction_data.amount,
+            category=transaction_data.category,
+            description=transaction_data.description,
+            created_by=current_user.id
+        )
+        
+        # Send DTO to service, get DTO back
+        result_dto = await self.transaction_service.create_transaction(transaction_dto, current_user)
+        
+        return result_dto
 
+    @value_error_to_http(status.HTTP_404_NOT_FOUND, "Transaction not found", "/finance/transactions/{transaction_id}")
     async def get_transaction(self,
                           transaction_id: UUID,
-                          current_user: User) -> FinancialTransactionResponse:
+                          current_user: User) -> TransactionDTO:
         """Retrieve a single transaction by ID."""
-        try:
-            result_dto = await self.transaction_service.get_transaction(transaction_id)
-            self._check_transaction_access(result_dto, current_user)
-            
-            return FinancialTransactionResponse(
-                id=result_dto.id,
-                client_id=result_dto.client_id,
-                transaction_date=result_dto.transaction_date,
-                amount=result_dto.amount,
-                category=result_dto.category,
-                description=result_dto.description,
-                created_by=result_dto.created_by
-            )
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "type": "about:blank",
-                    "title": "Transaction not found",
-                    "status": 404,
-                    "detail": str(e),
-                    "instance": f"/finance/transactions/{transaction_id}"
-                }
-            )
+        result_dto = await self.transaction_service.get_transaction(transaction_id)
+        self._check_transaction_access(result_dto, current_user)
+        return result_dto
 
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Invalid search parameters", "/finance/transactions")
     async def search_transactions(self,
                               client_id: Optional[UUID] = None,
                               category: Optional[str] = None,
@@ -127,122 +90,75 @@ class FinancialTransactionController(IFinancialTransactionController):
                               max_amount: Optional[float] = None,
                               current_user: User = None) -> List[FinancialTransactionResponse]:
         """Search for transactions with various filters."""
-        try:
-            # For client role, force client_id filter to their own id
-            if current_user.role.name == "client":
-                client_id = current_user.client_id
-            
-            result_dtos = await self.transaction_service.search_transactions(
-                client_id=client_id,
-                category=category,
-                start_date=start_date,
-                end_date=end_date,
-                min_amount=min_amount,
-                max_amount=max_amount
-            )
+        # For client role, force client_id filter to their own id
+        if current_user.is_client:
+            client_id = current_user.client_id
+        
+        result_dtos = await self.transaction_service.search_transactions(
+            client_id=client_id,
+            category=category,
+            start_date=start_date,
+            end_date=end_date,
+            min_amount=min_amount,
+            max_amount=max_amount
+        )
+
+        # Convert DTOs to Responses; DTOs are already validated so skip re-validating each row
+        return [
+            FinancialTransactionResponse.model_construct(**vars(result_dto)) for result_dto in result_dtos
+        ]
+
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Invalid search parameters", "/finance/transactions")
+    def stream_transactions(self,
+                            client_id: Optional[UUID] = None,
+                            category: Optional[str] = None,
+                            start_date: Optional[date] = None,
+                            end_date: Optional[date] = None,
+                            min_amount: Optional[float] = None,
+                            max_amount: Optional[float] = None,
+                            current_user: User = None) -> AsyncIterator[bytes]:
+        """Search for transactions, yielding one JSON document per line."""
+        # For client role, force client_id filter to their own id
+        if current_user.is_client:
+            client_id = current_user.client_id
 
-            # Convert DTOs to Responses
-            return [
-                FinancialTransactionResponse(
-                    id=result_dto.id,
-                    client_id=result_dto.client_id,
-                    transaction_date=result_dto.transaction_date,
-                    amount=result_dto.amount,
-                    category=result_dto.category,
-                    description=result_dto.description,
-                    created_by=result_dto.created_by
-                ) for result_dto in result_dtos
-            ]
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Invalid search parameters",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": "/finance/transactions"
-                }
-            )
+        result_dtos = self.transaction_service.stream_transactions(
+            client_id=client_id,
+            category=category,
+            start_date=start_date,
+            end_date=end_date,
+            min_amount=min_amount,
+            max_amount=max_amount
+        )
+        return ndjson_lines(result_dtos)
 
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Invalid update data", "/finance/transactions/{transaction_id}")
+    @value_error_to_http(status.HTTP_404_NOT_FOUND, "Transaction not found", "/finance/transactions/{transaction_id}", NotFoundError)
     async def update_transaction(self,
                              transaction_id: UUID,
                              transaction_data: FinancialTransactionUpdate,
-                             current_user: User) -> FinancialTransactionResponse:
+                             current_user: User) -> TransactionDTO:
         """Update an existing transaction."""
-        try:
-            # Convert Request to DTO
-            update_dto = TransactionDTO(
-                id=transaction_id,
-                client_id=None, # Can't update client id
-                transaction_date=transaction_data.transaction_date,
-                amount=transaction_data.amount,
-                category=transaction_data.category,
-                description=transaction_data.description,
-                created_by=None # Can't update created_by
-            )
+        # Convert Request to DTO
+        update_dto = TransactionDTO(
+            id=transaction_id,
+            client_id=None, # Can't update client id
+            transaction_date=transaction_data.transaction_date,
+            amount=transaction_data.amount,
+            category=transaction_data.category,
+            description=transaction_data.description,
+            created_by=None # Can't update created_by
+        )
 
-            # Send DTO to service, get DTO back
-            result_dto = await self.transaction_service.update_transaction(update_dto, current_user)
+        # Send DTO to service, get DTO back
+        result_dto = await self.transaction_service.update_transaction(update_dto, current_user)
 
-            # Convert DTO to Response
-            return FinancialTransactionResponse(
-                id=result_dto.id,
-                client_id=result_dto.client_id,
-                transaction_date=result_dto.transaction_date,
-                amount=result_dto.amount,
-                category=result_dto.category,
-                description=result_dto.description,
-                created_by=result_dto.created_by
-            )
-        except ValueError as e:
-            if "not found" in str(e):
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={
-                        "type": "about:blank",
-                        "title": "Transaction not found",
-                        "status": 404,
-                        "detail": str(e),
-                        "instance": f"/finance/transactions/{transaction_id}"
-                    }
-                )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Invalid update data",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": f"/finance/transactions/{transaction_id}"
-                }
-            )
+        return result_dto
 
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Delete operation failed", "/finance/transactions/{transaction_id}")
+    @value_error_to_http(status.HTTP_404_NOT_FOUND, "Transaction not found", "/finance/transactions/{transaction_id}", NotFoundError)
     async def delete_transaction(self,
                              transaction_id: UUID,
                              current_user: User) -> None:
         """Delete a transaction."""
-        try: 
-            await self.transaction_service.delete_transaction(transaction_id, current_user)
-        except ValueError as e:
-            if "not found" in str(e):
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={
-                        "type": "about:blank",
-                        "title": "Transaction not found",
-                        "status": 404,
-                        "detail": str(e),
-                        "instance": f"/finance/transactions/{transaction_id}"
-                    }
-                )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Delete operation failed",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": f"/finance/transactions/{transaction_id}"
-                }
-            )
\ No newline at end of file
+        await self.transaction_service.delete_transaction(transaction_id, current_user)
@@ -1,14 +1,46 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from datetime import date
-from fastapi import HTTPException, status
+from decimal import Decimal
+from fastapi import status
 
 from ..interfaces.controllers.invoice_controller import IInvoiceController
 from ..interfaces.services.invoice_service import IInvoiceService
+from ..interfaces.repositories.cache_repository import ICacheRepository
+from ..entities.invoice import STATUS_BY_VALUE
 from ..entities.user import User
 from ..schemas.request.invoice import InvoiceCreate, InvoiceUpdate
 from ..schemas.response.invoice import InvoiceResponse
 from ..schemas.dto.invoice_dto import InvoiceDTO
+from ..services.errors import NotFoundError
+from ..utils.http_errors import value_error_to_http, problem_template, StaticHTTPException
+from ..utils.ndjson import ndjson_lines
+from ..utils.clock import today
+
+# 403 body encoded once; a denial only encodes its instance
+INVOICE_FORBIDDEN_BODY = problem_template({
+    "type": "about:blank",
+    "title": "Access denied",
+    "status": 403,
+    "detail": "You can only access your own invoices"
+})
+
+# Overdue lists are cached per client for the day they were computed on (the key carries the
+# date); writes through this controller clear the namespace, the TTL bounds staleness otherwise
+OVERDUE_CACHE_TTL = 3600
+
+def _cached_dto(data: dict) -> InvoiceDTO:
+    """Rebuild an InvoiceDTO from its cached JSON form."""
+    return InvoiceDTO(
+        id=UUID(data["id"]),
+        client_id=UUID(data["client_id"]),
+        amount_due=Decimal(data["amount_due"]),
+        amount_paid=Decimal(data["amount_paid"]),
+        status=STATUS_BY_VALUE[data["status"]],
+        invoice_date=date.fromisoformat(data["invoice_date"]),
+        due_date=date.fromisoformat(data["due_date"]),
+        created_by=UUID(data["created_by"])
+    )
 
 class InvoiceController(IInvoiceController):
     """
@@ -16,9 +48,10 @@ class InvoiceController(IInvoiceController):
     Handles access control and coordinates between routes and services.
     """
     
-    def __init__(self, invoice_service: IInvoiceService):
-        """Initialize controller with database session."""
+    def __init__(self, invoice_service: IInvoiceService, invoice_cache: ICacheRepository):
+        """Initialize controller with its injected service and cache."""
         self.invoice_service = invoice_service
+        self.invoice_cache = invoice_cache
 
     def _check_invoice_access(self, invoice_dto: InvoiceDTO, current_user: User):
         """
@@ -31,18 +64,10 @@ class InvoiceController(IInvoiceController):
         Raises:
             HTTPException: If access is denied
         """
-        if current_user.role.name == "client" and invoice_dto.client_id != current_user.client_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={
-                    "type": "about:blank",
-                    "title": "Access denied",
-                    "status": 403,
-                    "detail": "You can only access your own invoices",
-                    "instance": f"/invoices/{invoice_dto.id}"
-                }
-            )
+        if current_user.is_client and invoice_dto.client_id != current_user.client_id:
+            raise StaticHTTPException(status.HTTP_403_FORBIDDEN, INVOICE_FORBIDDEN_BODY(f"/invoices/{invoice_dto.id}"))
 
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Invalid invoice data", "/invoices")
     async def create_invoice(self, invoice_data: InvoiceCreate, current_user: User) -> InvoiceResponse:
         """
         Create a new invoice.
@@ -57,46 +82,17 @@ class InvoiceController(IInvoiceController):
         Raises:
             HTTPException: If creation fails or permissions not met
         """
-        try:
-            # Convert Request to DTO
-            invoice_dto = InvoiceDTO(
-                id=None,
-                client_id=invoice_data.client_id,
-                invoice_date=invoice_data.invoice_date,
-                due_date=invoice_data.due_date,
-                amount_due=invoice_data.amount_due,
-                amount_paid=invoice_data.amount_paid or 0,
-                created_by=current_user.id,
-                status=None
-            )
-            
-            # Send DTO to service, get DTO back
-            result_dto = await self.invoice_service.create_invoice(invoice_dto, current_user)
+        # Convert Request to DTO
+        invoice_dto = InvoiceDTO.from_create(invoice_data, current_user.id)
 
-            # Convert DTO to Response
-            return InvoiceResponse(
-                id=result_dto.id,
-                client_id=result_dto.client_id,
-                invoice_date=result_dto.invoice_date,
-                due_date=result_dto.due_date,
-                amount_due=result_dto.amount_due,
-                amount_paid=result_dto.amount_paid,
-                status=result_dto.status,
-                created_by=result_dto.created_by
-            )
-            
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Invalid invoice data",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": "/invoices"
-                }
-            )
+        # Send DTO to service, get DTO back
+        result_dto = await self.invoice_service.create_invoice(invoice_dto, current_user)
+        await self.invoice_cache.clear()
+
+        # Convert DTO to Response
+        return InvoiceResponse.model_construct(**vars(result_dto))
 
+    @value_error_to_http(status.HTTP_404_NOT_FOUND, "Invoice not found", "/invoices/{invoice_id}")
     async def get_invoice(self, invoice_id: UUID, current_user: User) -> InvoiceResponse:
         """
         Get a specific invoice by ID.
@@ -111,35 +107,15 @@ class InvoiceController(IInvoiceController):
         Raises:
             HTTPException: If invoice not found or access denied
         """
-        try:
-            result_dto = await self.invoice_service.get_invoice(invoice_id)
+        result_dto = await self.invoice_service.get_invoice(invoice_id)
+        
+        # Access control
+        self._check_invoice_access(result_dto, current_user)
             
-            # Access control
-            self._check_invoice_access(result_dto, current_user)
-                
-             # Convert DTO to Response
-            return InvoiceResponse(
-                id=result_dto.id,
-                client_id=result_dto.client_id,
-                invoice_date=result_dto.invoice_date,
-                due_date=result_dto.due_date,
-                amount_due=result_dto.amount_due,
-                amount_paid=result_dto.amount_paid,
-                status=result_dto.status,
-                created_by=result_dto.created_by
-            )
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "type": "about:blank",
-                    "title": "Invoice not found",
-                    "status": 404,
-                    "detail": str(e),
-                    "instance": f"/invoices/{invoice_id}"
-                }
-            )
+        # Convert DTO to Response
+        return InvoiceResponse.model_construct(**vars(result_dto))
 
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Invalid search parameters", "/invoices")
     async def search_invoices(self,
                           client_id: Optional[UUID] = None,
                           status: Optional[str] = None,
@@ -168,47 +144,58 @@ class InvoiceController(IInvoiceController):
         Raises:
             HTTPException: If search parameters are invalid
         """
-        try:
-            # For client role, force client_id filter to their own id
-            if current_user.role.name == "client":
-                client_id = current_user.client_id
+        # For client role, force client_id filter to their own id
+        if current_user.is_client:
+            client_id = current_user.client_id
+
+        result_dtos = await self.invoice_service.search_invoices(
+            client_id=client_id,
+            status=status,
+            start_date=start_date,
+            end_date=end_date,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            is_overdue=is_overdue
+        )
+        # Convert DTOs to Responses; DTOs are already validated so skip re-validating each row
+        return [
+            InvoiceResponse.model_construct(**vars(dto))
+            for dto in result_dtos
+        ]
+
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Invalid search parameters", "/invoices")
+    def stream_invoices(self,
+                        client_id: Optional[UUID] = None,
+                        status: Optional[str] = None,
+                        start_date: Optional[date] = None,
+                        end_date: Optional[date] = None,
+                        min_amount: Optional[float] = None,
+                        max_amount: Optional[float] = None,
+                        is_overdue: Optional[bool] = None,
+                        current_user: User = None) -> AsyncIterator[bytes]:
+        """
+        Search invoices, yielding one JSON document per line.
 
-            result_dtos = await self.invoice_service.search_invoices(
-                client_id=client_id,
-                status=status,
-                start_date=start_date,
-                end_date=end_date,
-                min_amount=min_amount,
-                max_amount=max_amount,
-                is_overdue=is_overdue
-            )
-            # Convert DTOs to Responses
-            return [
-                InvoiceResponse(
-                    id=dto.id,
-                    client_id=dto.client_id,
-                    invoice_date=dto.invoice_date,
-                    due_date=dto.due_date,
-                    amount_due=dto.amount_due,
-                    amount_paid=dto.amount_paid,
-                    status=dto.status,
-                    created_by=dto.created_by
-                )
-                for dto in result_dtos
-            ]
+        Raises:
+            HTTPException: If search parameters are invalid
+        """
+        # For client role, force client_id filter to their own id
+        if current_user.is_client:
+            client_id = current_user.client_id
 
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Invalid search parameters",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": "/invoices"
-                }
-            )
+        result_dtos = self.invoice_service.stream_invoices(
+            client_id=client_id,
+            status=status,
+            start_date=start_date,
+            end_date=end_date,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            is_overdue=is_overdue
+        )
+        return ndjson_lines(result_dtos)
 
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Invalid update data", "/invoices/{invoice_id}")
+    @value_error_to_http(status.HTTP_404_NOT_FOUND, "Invoice not found", "/invoices/{invoice_id}", NotFoundError)
     async def update_invoice(self,
                          invoice_id: UUID,
                          invoice_data: InvoiceUpdate,
@@ -227,56 +214,27 @@ class InvoiceController(IInvoiceController):
         Raises:
             HTTPException: If update fails or access denied
         """
-        try:
-            # Convert Request to DTO
-            update_dto = InvoiceDTO(
-                id=invoice_id,
-                client_id=None,  # Can't update client_id
-                invoice_date=invoice_data.invoice_date,
-                due_date=invoice_data.due_date,
-                amount_due=invoice_data.amount_due,
-                amount_paid=invoice_data.amount_paid,
-                status=None,  # Will be calculated by service
-                created_by=None  # Can't update created_by
-            )
+        # Convert Request to DTO
+        update_dto = InvoiceDTO(
+            id=invoice_id,
+            client_id=None,  # Can't update client_id
+            invoice_date=invoice_data.invoice_date,
+            due_date=invoice_data.due_date,
+            amount_due=invoice_data.amount_due,
+            amount_paid=invoice_data.amount_paid,
+            status=None,  # Will be calculated by service
+            created_by=None  # Can't update created_by
+        )
 
-            # Send DTO to service, get DTO back
-            result_dto = await self.invoice_service.update_invoice(update_dto, current_user)
+        # Send DTO to service, get DTO back
+        result_dto = await self.invoice_service.update_invoice(update_dto, current_user)
+        await self.invoice_cache.clear()
 
-            # Convert DTO to Response
-            return InvoiceResponse(
-                id=result_dto.id,
-                client_id=result_dto.client_id,
-                invoice_date=result_dto.invoice_date,
-                due_date=result_dto.due_date,
-                amount_due=result_dto.amount_due,
-                amount_paid=result_dto.amount_paid,
-                status=result_dto.status,
-                created_by=result_dto.created_by
-            )
-        except ValueError as e:
-            if "not found" in str(e):
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={
-                        "type": "about:blank",
-                        "title": "Invoice not found",
-                        "status": 404,
-                        "detail": str(e),
-                        "instance": f"/invoices/{invoice_id}"
-                    }
-                )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Invalid update data",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": f"/invoices/{invoice_id}"
-                }
-            )
+        # Convert DTO to Response
+        return InvoiceResponse.model_construct(**vars(result_dto))
 
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Delete operation failed", "/invoices/{invoice_id}")
+    @value_error_to_http(status.HTTP_404_NOT_FOUND, "Invoice not found", "/invoices/{invoice_id}", NotFoundError)
     async def delete_invoice(self, invoice_id: UUID, current_user: User) -> None:
         """
         Delete an invoice.
@@ -291,32 +249,11 @@ class InvoiceController(IInvoiceController):
         Raises:
             HTTPException: If deletion fails or access denied
         """
-        try:
-            # Simply pass ID to service
-            await self.invoice_service.delete_invoice(invoice_id, current_user)
-        except ValueError as e:
-            if "not found" in str(e):
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={
-                        "type": "about:blank",
-                        "title": "Invoice not found",
-                        "status": 404,
-                        "detail": str(e),
-                        "instance": f"/invoices/{invoice_id}"
-                    }
-                )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "type": "about:blank",
-                    "title": "Delete operation failed",
-                    "status": 400,
-                    "detail": str(e),
-                    "instance": f"/invoices/{invoice_id}"
-                }
-            )
+        # Simply pass ID to service
+        await self.invoice_service.delete_invoice(invoice_id, current_user)
+        await self.invoice_cache.clear()
 
+    @value_error_to_http(status.HTTP_400_BAD_REQUEST, "Invalid request", "/invoices/overdue")
     async def get_overdue_invoices(self, current_user: User) -> List[InvoiceResponse]:
         """
         Get all overdue invoices.
@@ -327,27 +264,20 @@ class InvoiceController(IInvoiceController):
         Returns:
             List[Invoice]: List of overdue invoices
         """
-        try:
-            # Pass client_id if it's a client user
-            client_id = current_user.client_id if current_user.role.name == "client" else None
-            
+        # Pass client_id if it's a client user
+        client_id = current_user.client_id if current_user.is_client else None
+        
+        cache_key = f"overdue:{client_id or 'all'}:{today()}"
+        cached = await self.invoice_cache.get(cache_key)
+        if cached is not None:
+            result_dtos = [_cached_dto(data) for data in cached]
+        else:
             # Get DTOs from service
             result_dtos = await self.invoice_service.get_overdue_invoices(client_id)
+            await self.invoice_cache.set(cache_key, result_dtos, ttl=OVERDUE_CACHE_TTL)
 
-            # Convert DTOs to Responses
-            return [
-                InvoiceResponse(
-                    id=dto.id,
-                    client_id=dto.client_id,
-                    invoice_date=dto.invoice_date,
-                    due_date=dto.due_date,
-                    amount_due=dto.amount_due,
-                    amount_paid=dto.amount_paid,
-                    status=dto.status,
-                    created_by=dto.created_by
-                )
-                for dto in result_dtos
-            ]
-
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        # Convert DTOs to Responses; DTOs are already validated so skip re-validating each row
+        return [
+            InvoiceResponse.model_construct(**vars(dto))
+            for dto in result_dtos
+        ]
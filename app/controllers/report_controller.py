@@ -1,10 +1,26 @@
+from typing import Optional
 from uuid import UUID
 from fastapi import HTTPException, status
 from io import BytesIO
 
 from ..interfaces.controllers.report_controller import IReportController
 from ..interfaces.services.report_service import IReportService
+from ..interfaces.repositories.cache_repository import ICacheRepository
 from ..entities.user import User
+from ..utils.rate_limiter import RateLimiter, RateLimitExceeded
+from ..utils.http_errors import value_error_to_http, problem_template, StaticHTTPException
+
+# 403 body encoded once; a denial only encodes its instance
+REPORT_FORBIDDEN_BODY = problem_template({
+    "type": "about:blank",
+    "title": "Access denied",
+    "status": 403,
+    "detail": "You can only access your own reports"
+})
+
+# Rendered PDFs are keyed by their data version, so a hit can never be stale data;
+# the TTL only bounds memory and how old the "Generated on" line can get
+REPORT_CACHE_TTL = 600
 
 class ReportController(IReportController):
     """
@@ -12,14 +28,19 @@ class ReportController(IReportController):
     Manages access control and coordinates between routes and services.
     """
     
-    def __init__(self, report_service: IReportService):
+    def __init__(self, report_service: IReportService, report_cache: ICacheRepository,
+                 rate_limiter: RateLimiter):
         """
-        Initialize controller with database session.
+        Initialize controller with its injected service, cache and rate limiter.
         
         Args:
-            db: Database session
+            report_service: Report service
+            report_cache: Cache for rendered reports
+            rate_limiter: Limiter for PDF renders per user
         """
         self.report_service = report_service
+        self.report_cache = report_cache
+        self.rate_limiter = rate_limiter
 
     def _check_client_access(self, client_id: UUID, current_user: User) -> None:
         """
@@ -32,23 +53,73 @@ class ReportController(IReportController):
         Raises:
             HTTPException: If access is denied
         """
-        if current_user.role.name == "client" and str(client_id) != str(current_user.client_id):
+        if current_user.is_client and client_id != current_user.client_id:
+            raise StaticHTTPException(status.HTTP_403_FORBIDDEN, REPORT_FORBIDDEN_BODY(f"/clients/{client_id}/report"))
+
+    def _check_rate_limit(self, client_id: UUID, current_user: User) -> None:
+        """
+        Count a PDF render against the user's rate limit.
+
+        Args:
+            client_id: UUID of client
+            current_user: Current authenticated user
+
+        Raises:
+            HTTPException: If rate limit is exceeded
+        """
+        try:
+            self.rate_limiter.check_rate_limit(str(current_user.id))
+        except RateLimitExceeded as e:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail={
                     "type": "about:blank",
-                    "title": "Access denied",
-                    "status": 403,
-                    "detail": "You can only access your own reports",
+                    "title": "Too Many Requests",
+                    "status": 429,
+                    "detail": f"Rate limit exceeded for PDF generation. Please try again in {e.wait_time} seconds.",
                     "instance": f"/clients/{client_id}/report"
                 }
             )
 
+    @value_error_to_http(status.HTTP_404_NOT_FOUND, "Not Found", "/clients/{client_id}/report")
+    async def get_report_version(self,
+                                 client_id: UUID,
+                                 current_user: User,
+                                 include_transactions: bool = True,
+                                 include_invoices: bool = True
+                                ) -> str:
+        """
+        Get the version tag of a client's report, used as its ETag.
+
+        Cheap aggregate queries only, so an unchanged report can be answered without rendering it.
+
+        Args:
+            client_id: UUID of client
+            current_user: Current authenticated user
+            include_transactions: Whether the report includes transactions
+            include_invoices: Whether the report includes invoices
+
+        Returns:
+            str: Report version tag
+
+        Raises:
+            HTTPException: If client not found or access denied
+        """
+        self._check_client_access(client_id, current_user)
+
+        return await self.report_service.get_report_version(
+            client_id,
+            include_transactions=include_transactions,
+            include_invoices=include_invoices
+        )
+
+    @value_error_to_http(status.HTTP_404_NOT_FOUND, "Not Found", "/clients/{client_id}/report")
     async def generate_client_financial_report(self, 
                                           client_id: UUID, 
                                           current_user: User,
                                           include_transactions: bool = True,
-                                          include_invoices: bool = True
+                                          include_invoices: bool = True,
+                                          version: Optional[str] = None
                                         ) -> BytesIO:
         """
         Generate a financial report for a client.
@@ -58,30 +129,33 @@ class ReportController(IReportController):
             current_user: Current authenticated user
             include_transactions: Whether to include transactions section
             include_invoices: Whether to include invoices section
+            version: Report version from get_report_version; when given, the rendered
+                PDF is cached under it and reused while the data is unchanged
             
         Returns:
             BytesIO: PDF report buffer
             
         Raises:
-            HTTPException: If client not found or access denied
+            HTTPException: If client not found, access denied or the render rate limit is exceeded
         """
         # Check access first
         self._check_client_access(client_id, current_user)
-        
-        try:
-            return await self.report_service.generate_client_financial_report(
-                client_id,
-                include_transactions=include_transactions,
-                include_invoices=include_invoices
-            )
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "type": "about:blank",
-                    "title": "Not Found",
-                    "status": 404,
-                    "detail": str(e),
-                    "instance": f"/clients/{client_id}/report"
-                }
-            )
\ No newline at end of file
+
+        # The version already covers the section flags
+        cache_key = f"{client_id}:{version}"
+        if version is not None:
+            cached = await self.report_cache.get_bytes(cache_key)
+            if cached is not None:
+                return BytesIO(cached)
+
+        # Only renders count against the quota, not cache hits or 304s
+        self._check_rate_limit(client_id, current_user)
+        pdf_buffer = await self.report_service.generate_client_financial_report(
+            client_id,
+            include_transactions=include_transactions,
+            include_invoices=include_invoices
+        )
+
+        if version is not None:
+            await self.report_cache.set_bytes(cache_key, pdf_buffer.getvalue(), ttl=REPORT_CACHE_TTL)
+        return pdf_buffer
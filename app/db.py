@@ -1,17 +1,76 @@
-from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.sql import Executable
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session, ORMExecuteState, raiseload
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from .config import settings
+from .config import get_settings
 
+settings = get_settings()
 DATABASE_URL = settings.database_url
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def async_database_url(url: str) -> URL:
+    """Point a PostgreSQL URL at the asyncpg driver, leaving other URLs as given."""
+    url = make_url(url)
+    if url.get_backend_name() == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+engine = create_async_engine(
+    async_database_url(DATABASE_URL),
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True
+)
+
+RAISELOAD_APPLIED = "raiseload_applied"
+
+def prebuilt(statement: Executable) -> Executable:
+    """Finish a fixed-shape query built once at import time.
+
+    Values go in as bindparams supplied per call. Keeping the same statement
+    object lets SQLAlchemy reuse its memoized cache key instead of rebuilding
+    and re-keying the query on every request.
+    """
+    return statement.options(raiseload("*")).execution_options(**{RAISELOAD_APPLIED: True})
+
+class AppSession(Session):
+    """Session whose queries never lazy load relationships."""
+
+@event.listens_for(AppSession, "do_orm_execute")
+def _raise_on_lazy_load(state: ORMExecuteState) -> None:
+    # Relationships a repository doesn't load eagerly raise on access instead of
+    # emitting a query from wherever they happen to be touched (which can't await anyway)
+    if (state.is_select and not state.is_column_load and not state.is_relationship_load
+            and not state.execution_options.get(RAISELOAD_APPLIED)):
+        state.statement = state.statement.options(raiseload("*"))
+
+SessionLocal = async_sessionmaker(engine, sync_session_class=AppSession, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+class SessionScopeMiddleware:
+    """ASGI middleware closing the request's database session.
+
+    The container hands out one session per request context; this returns
+    its connection to the pool once the response has been sent.
+    """
+
+    def __init__(self, app, session_provider):
+        self.app = app
+        self.session_provider = session_provider
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await self.session_provider().close()
+            self.session_provider.reset()
@@ -1,73 +1,151 @@
-from fastapi import Depends, HTTPException, status
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import NamedTuple, Optional, Tuple, Union
+from uuid import UUID
+from fastapi import Depends, status
 from fastapi.security import OAuth2PasswordBearer
 from dependency_injector.wiring import inject, Provide
 
 from ..container import Container
 from ..utils.jwt import verify_token
 from ..repositories.user_repository import UserRepository
-from ..services.permission_service import PermissionService
+from ..entities.user import User
+from ..utils.http_errors import problem_body, StaticHTTPException
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Fully static, so sent as pre-encoded bytes
+NO_SUBJECT_BODY = problem_body({
+    "type": "about:blank",
+    "title": "Invalid authentication credentials",
+    "status": 401,
+    "detail": "User ID not found in token",
+    "instance": "/auth/token"
+})
+
+UNKNOWN_USER_BODY = problem_body({
+    "type": "about:blank",
+    "title": "Invalid authentication credentials",
+    "status": 401,
+    "detail": "User not found",
+    "instance": "/auth/token"
+})
+
+# Authenticated users by token, so repeat requests skip the JWT check and the user queries.
+# Entries never outlive the token, and USER_CACHE_TTL bounds how long a role change
+# or a deleted user can go unnoticed.
+USER_CACHE_TTL = 30.0
+USER_CACHE_SIZE = 10_000
+
+class _PermissionSnapshot(NamedTuple):
+    resource: str
+    action: str
+
+class _RoleSnapshot(NamedTuple):
+    """Read-only copy of a loaded role and its permissions, detached from the ORM session."""
+    name: str
+    updated_at: Optional[datetime]
+    permissions: Tuple[_PermissionSnapshot, ...]
+
+class _UserSnapshot(NamedTuple):
+    """
+    Read-only copy of an authenticated user; each request gets its own User built from it.
+
+    The password hash is left out: nothing past authentication reads it, and the cache
+    would otherwise keep every active user's hash in memory.
+    """
+    id: UUID
+    username: str
+    email: str
+    role_id: UUID
+    role: Union[_RoleSnapshot, str, None]
+    client_id: Optional[UUID]
+    created_at: datetime
+    updated_at: datetime
+
+_user_cache: "OrderedDict[bytes, Tuple[float, _UserSnapshot]]" = OrderedDict()
+
+def _token_key(token: str) -> bytes:
+    # A digest rather than the token itself, so no usable credentials sit in memory
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+def _snapshot(user: User) -> _UserSnapshot:
+    role = user.role
+    if role is not None and not isinstance(role, str):
+        role = _RoleSnapshot(
+            name=role.name,
+            updated_at=role.updated_at,
+            permissions=tuple(_PermissionSnapshot(perm.resource, perm.action) for perm in role.permissions)
+        )
+    return _UserSnapshot(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        role_id=user.role_id,
+        role=role,
+        client_id=user.client_id,
+        created_at=user.created_at,
+        updated_at=user.updated_at
+    )
+
+def _cached_user(key: bytes) -> Optional[User]:
+    entry = _user_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, snapshot = entry
+    if time.time() >= expires_at:
+        del _user_cache[key]
+        return None
+    _user_cache.move_to_end(key)
+    return User(password_hash="", **snapshot._asdict())
+
+def _remember_user(key: bytes, user: User, token_exp: Optional[float]) -> None:
+    expires_at = time.time() + USER_CACHE_TTL
+    if token_exp is not None:
+        expires_at = min(expires_at, token_exp)
+    _user_cache[key] = (expires_at, _snapshot(user))
+    _user_cache.move_to_end(key)
+    if len(_user_cache) > USER_CACHE_SIZE:
+        _user_cache.popitem(last=False)
+
 @inject
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     user_repository: UserRepository = Depends(Provide[Container.user_repository])
 ) -> dict:
     """Get the current authenticated user."""
+    key = _token_key(token)
+    user = _cached_user(key)
+    if user is not None:
+        return user
+
     payload = verify_token(token)
     user_id = payload.get("sub")
     if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "type": "about:blank",
-                "title": "Invalid authentication credentials",
-                "status": 401,
-                "detail": "User ID not found in token",
-                "instance": "/auth/token"
-            }
-        )
+        raise StaticHTTPException(status.HTTP_401_UNAUTHORIZED, NO_SUBJECT_BODY)
     
     user = await user_repository.get_by_id(user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "type": "about:blank",
-                "title": "Invalid authentication credentials",
-                "status": 401,
-                "detail": "User not found",
-                "instance": "/auth/token"
-            }
-        )
+        raise StaticHTTPException(status.HTTP_401_UNAUTHORIZED, UNKNOWN_USER_BODY)
+    _remember_user(key, user, payload.get("exp"))
     return user
 
 def check_permissions(required_resource: str, required_action: str):
     """Decorator to check if the user has the required permissions."""
-    @inject
-    async def permission_checker(
-        current_user: dict = Depends(get_current_user),
-        permission_service: PermissionService = Depends(Provide[Container.permission_service])
-    ):
-
-        # Check if Permission Entity is not None
-        permission_entity = await permission_service.check_permission(
-            role_id=current_user.role_id,
-            resource=required_resource,
-            action=required_action
-        )
-        
-        if not permission_entity:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={
-                    "type": "about:blank",
-                    "title": "Forbidden",
-                    "status": 403,
-                    "detail": "Not enough permissions",
-                    "instance": f"/{required_resource}"
-                }
-            )
+    # Everything in the 403 body is known per route, so it is encoded once here
+    forbidden_body = problem_body({
+        "type": "about:blank",
+        "title": "Forbidden",
+        "status": 403,
+        "detail": "Not enough permissions",
+        "instance": f"/{required_resource}"
+    })
+
+    async def permission_checker(current_user: dict = Depends(get_current_user)):
+        # The user is loaded with its role's permissions, so this needs no query of its own
+        if not current_user.has_permission(required_resource, required_action):
+            raise StaticHTTPException(status.HTTP_403_FORBIDDEN, forbidden_body)
         return current_user
     return permission_checker
\ No newline at end of file
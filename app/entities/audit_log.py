@@ -4,6 +4,8 @@ from uuid import UUID
 from enum import Enum
 from typing import Dict, Any, Optional
 
+import orjson
+
 class ChangeType(str, Enum):
     CREATE = "CREATE"
     UPDATE = "UPDATE"
@@ -18,7 +20,12 @@ class Resource(str, Enum):
     PERMISSION = "permissions"
     ROLE = "roles"
 
-@dataclass
+# Plain value per member, precomputed for to_dict. Both enums subclass str, so these
+# dicts answer for a member and for its value string alike, without an Enum(...) call
+_CHANGE_TYPE_VALUES = {member.value: member.value for member in ChangeType}
+_RESOURCE_VALUES = {member.value: member.value for member in Resource}
+
+@dataclass(slots=True)
 class AuditLog:
     """Entity representing an audit log entry with core business rules."""
     id: UUID
@@ -33,10 +40,17 @@ class AuditLog:
         """Convert audit log to dictionary format."""
         return {
             'id': str(self.id),
-            'changed_by': str(self.changed_by),
-            'table_name': self.resource.value,
+            'changed_by': str(self.changed_by) if self.changed_by else None,
+            # Services pass plain strings, rows loaded back hold whatever the column had
+            'table_name': _RESOURCE_VALUES[self.table_name],
             'record_id': str(self.record_id),
-            'change_type': self.change_type.value,
+            'change_type': _CHANGE_TYPE_VALUES[self.change_type],
             'change_details': self.change_details,
             'timestamp': self.timestamp.isoformat()
         }
+
+    def to_json(self) -> bytes:
+        """Encode the audit log directly, without building the intermediate dict of to_dict."""
+        # orjson handles the UUIDs, enums and datetime itself, writing the timestamp as
+        # isoformat() does so both methods give the same document
+        return orjson.dumps(self)
@@ -5,7 +5,7 @@ from typing import Optional, List
 from uuid import UUID
 from enum import Enum
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class Client:
     id: UUID
     name: str
@@ -21,7 +21,7 @@ class Client:
                       address: Optional[str] = None) -> None:
         """Update client details with validation."""
         if name is not None:
-            if len(name.strip()) == 0:
+            if not name or name.isspace():
                 raise ValueError("Client name cannot be empty")
             self.name = name
         if industry is not None:
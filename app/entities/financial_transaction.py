@@ -5,7 +5,11 @@ from typing import Optional, List
 from uuid import UUID
 from enum import Enum
 
-@dataclass
+from ..utils.clock import today
+
+ZERO = Decimal(0)
+
+@dataclass(slots=True, kw_only=True)
 class FinancialTransaction:
     id: UUID
     client_id: UUID
@@ -21,14 +25,31 @@ class FinancialTransaction:
         self.validate_amount()
         self.validate_dates()
 
+    @classmethod
+    def from_trusted(cls, *, id: UUID, client_id: UUID, created_by: UUID, transaction_date: date,
+                     amount: Decimal, description: Optional[str], category: Optional[str],
+                     created_at: datetime, updated_at: datetime) -> "FinancialTransaction":
+        """Build a transaction from stored fields, which were validated when written, without __post_init__."""
+        transaction = cls.__new__(cls)
+        transaction.id = id
+        transaction.client_id = client_id
+        transaction.created_by = created_by
+        transaction.transaction_date = transaction_date
+        transaction.amount = amount
+        transaction.description = description
+        transaction.category = category
+        transaction.created_at = created_at
+        transaction.updated_at = updated_at
+        return transaction
+
     def validate_amount(self) -> None:
         """Validate transaction amount."""
-        if self.amount <= Decimal('0'):
+        if self.amount <= ZERO:
             raise ValueError("Transaction amount must be positive")
 
     def validate_dates(self) -> None:
         """Validate transaction dates."""
-        if self.transaction_date > date.today():
+        if self.transaction_date > today():
             raise ValueError("Transaction date cannot be in the future")
 
     def update_details(self, amount: Optional[Decimal] = None,
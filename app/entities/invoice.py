@@ -5,12 +5,24 @@ from typing import Optional, List
 from uuid import UUID
 from enum import Enum
 
+from ..utils.clock import today
+
+# Built once; Decimal('0') in the checks parsed a new Decimal on every validation
+ZERO = Decimal(0)
+
 class InvoiceStatus(str, Enum):
     PENDING = "PENDING"
     PARTIALLY_PAID = "PARTIALLY_PAID"
     PAID = "PAID"
 
-@dataclass
+# Members bound once so status updates and checks skip the Enum class attribute lookup;
+# update_status runs on every construction, so an invoice's status is always one of these
+PENDING = InvoiceStatus.PENDING
+PARTIALLY_PAID = InvoiceStatus.PARTIALLY_PAID
+PAID = InvoiceStatus.PAID
+STATUS_BY_VALUE = {member.value: member for member in InvoiceStatus}
+
+@dataclass(slots=True, kw_only=True)
 class Invoice:
     id: UUID
     client_id: UUID
@@ -28,11 +40,34 @@ class Invoice:
         self.validate_dates()
         self.update_status()
 
+    @classmethod
+    def from_trusted(cls, *, id: UUID, client_id: UUID, created_by: UUID, invoice_date: date,
+                     due_date: date, amount_due: Decimal, amount_paid: Decimal,
+                     created_at: datetime, updated_at: datetime) -> "Invoice":
+        """
+        Build an invoice from stored fields without re-running the validations.
+
+        Only for rows the repository loads, which were validated when written. The status
+        is still derived from the amounts rather than read back, so it cannot disagree with them.
+        """
+        invoice = cls.__new__(cls)
+        invoice.id = id
+        invoice.client_id = client_id
+        invoice.created_by = created_by
+        invoice.invoice_date = invoice_date
+        invoice.due_date = due_date
+        invoice.amount_due = amount_due
+        invoice.amount_paid = amount_paid
+        invoice.created_at = created_at
+        invoice.updated_at = updated_at
+        invoice.update_status()
+        return invoice
+
     def validate_amounts(self) -> None:
         """Validate invoice amounts."""
-        if self.amount_due <= Decimal('0'):
+        if self.amount_due <= ZERO:
             raise ValueError("Invoice amount must be positive")
-        if self.amount_paid < Decimal('0'):
+        if self.amount_paid < ZERO:
             raise ValueError("Paid amount cannot be negative")
         if self.amount_paid > self.amount_due:
             raise ValueError("Paid amount cannot exceed amount due")
@@ -45,19 +80,19 @@ class Invoice:
     def update_status(self) -> None:
         """Update invoice status based on amounts."""
         if self.amount_paid >= self.amount_due:
-            self.status = InvoiceStatus.PAID
-        elif self.amount_paid > 0:
-            self.status = InvoiceStatus.PARTIALLY_PAID
+            self.status = PAID
+        elif self.amount_paid > ZERO:
+            self.status = PARTIALLY_PAID
         else:
-            self.status = InvoiceStatus.PENDING
+            self.status = PENDING
 
     def record_payment(self, payment_amount: Decimal) -> None:
         """Record a payment with validation."""
-        if payment_amount <= Decimal('0'):
+        if payment_amount <= ZERO:
             raise ValueError("Payment amount must be positive")
         if self.amount_paid + payment_amount > self.amount_due:
             raise ValueError("Payment would exceed amount due")
-        if self.status == InvoiceStatus.PAID:
+        if self.status is PAID:
             raise ValueError("Invoice is already paid")
             
         self.amount_paid += payment_amount
@@ -66,8 +101,8 @@ class Invoice:
 
     def is_overdue(self) -> bool:
         """Check if invoice is overdue."""
-        return self.due_date < date.today() and self.status != InvoiceStatus.PAID
+        return self.due_date < today() and self.status is not PAID
 
     def can_be_deleted(self) -> bool:
         """Check if invoice can be deleted."""
-        return self.status != InvoiceStatus.PAID
\ No newline at end of file
+        return self.status is not PAID
\ No newline at end of file
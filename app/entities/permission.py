@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class Permission:
     id: UUID
     role_id: UUID
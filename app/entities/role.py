@@ -0,0 +1,11 @@
+from enum import Enum
+from uuid import UUID
+
+class RoleName(str, Enum):
+    ADMIN = "admin"
+    FINANCE = "finance"
+    AUDITOR = "auditor"
+    CLIENT = "client"
+
+# Seeded row of the client role, assigned to every self-registered user
+CLIENT_ROLE_ID = UUID("094f40bd-14de-48b0-8979-c8a7da41cab2")
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import FrozenSet, Optional, Tuple
 from uuid import UUID
 
-@dataclass
+from .role import RoleName
+
+@dataclass(slots=True, kw_only=True)
 class User:
     id: UUID
     username: str
@@ -15,6 +17,27 @@ class User:
     created_at: datetime
     updated_at: datetime
 
+    @property
+    def role_name(self) -> Optional[str]:
+        """Role name, whether the role was loaded as a model or given by name."""
+        return getattr(self.role, "name", self.role)
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role_name == RoleName.ADMIN
+
+    @property
+    def is_client(self) -> bool:
+        return self.role_name == RoleName.CLIENT
+
+    @property
+    def permissions(self) -> FrozenSet[Tuple[str, str]]:
+        """(resource, action) pairs granted by the role, when it was loaded with its permissions."""
+        return frozenset((perm.resource, perm.action) for perm in getattr(self.role, "permissions", ()))
+
+    def has_permission(self, resource: str, action: str) -> bool:
+        return (resource, action) in self.permissions
+
     def __post_init__(self):
         self.validate_username()
         self.validate_email()
@@ -1,9 +1,9 @@
 # interfaces/controller/auth_controller.py
 from abc import ABC, abstractmethod
-from typing import Dict, Any
 from fastapi.security import OAuth2PasswordRequestForm
 from ...schemas.request.signup import SignupRequest
 from ...schemas.response.login import LoginResponse
+from ...schemas.response.user_info import UserInfoResponse
 
 class IAuthController(ABC):
     @abstractmethod
@@ -26,6 +26,6 @@ class IAuthController(ABC):
     async def get_current_user_info(
         self, 
         current_user: dict
-    ) -> Dict[str, Any]:
+    ) -> UserInfoResponse:
         """Get current user information in API format."""
         pass
\ No newline at end of file
@@ -4,6 +4,7 @@ from typing import List
 from uuid import UUID
 from ...schemas.request.client import ClientCreate, ClientUpdate
 from ...schemas.response.client import ClientResponse
+from ...schemas.dto.client_dto import ClientDTO
 from ...entities.user import User
 
 class IClientController(ABC):
@@ -12,7 +13,7 @@ class IClientController(ABC):
         self, 
         client_data: ClientCreate, 
         current_user: User
-    ) -> ClientResponse:
+    ) -> ClientDTO:
         """Create a new client."""
         pass
 
@@ -21,7 +22,7 @@ class IClientController(ABC):
         self, 
         client_id: UUID, 
         current_user: User
-    ) -> ClientResponse:
+    ) -> ClientDTO:
         """Get a specific client."""
         pass
 
@@ -41,7 +42,7 @@ class IClientController(ABC):
         client_id: UUID,
         client_data: ClientUpdate,
         current_user: User
-    ) -> ClientResponse:
+    ) -> ClientDTO:
         """Update a client."""
         pass
 
@@ -1,11 +1,12 @@
 # interfaces/controller/financial_transaction_controller.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from datetime import date
 from ...entities.user import User
 from ...schemas.request.financial_transaction import FinancialTransactionCreate, FinancialTransactionUpdate
 from ...schemas.response.financial_transaction import FinancialTransactionResponse
+from ...schemas.dto.transaction_dto import TransactionDTO
 
 class IFinancialTransactionController(ABC):
     @abstractmethod
@@ -13,7 +14,7 @@ class IFinancialTransactionController(ABC):
         self,
         transaction_data: FinancialTransactionCreate,
         current_user: User
-    ) -> FinancialTransactionResponse:
+    ) -> TransactionDTO:
         """Create a new transaction."""
         pass
 
@@ -22,7 +23,7 @@ class IFinancialTransactionController(ABC):
         self,
         transaction_id: UUID,
         current_user: User
-    ) -> FinancialTransactionResponse:
+    ) -> TransactionDTO:
         """Get a specific transaction."""
         pass
 
@@ -40,13 +41,27 @@ class IFinancialTransactionController(ABC):
         """Search and filter transactions."""
         pass
 
+    @abstractmethod
+    def stream_transactions(
+        self,
+        client_id: Optional[UUID] = None,
+        category: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        current_user: User = None
+    ) -> AsyncIterator[bytes]:
+        """Search and filter transactions, encoded as newline-delimited JSON."""
+        pass
+
     @abstractmethod
     async def update_transaction(
         self,
         transaction_id: UUID,
         transaction_data: FinancialTransactionUpdate,
         current_user: User
-    ) -> FinancialTransactionResponse:
+    ) -> TransactionDTO:
         """Update a transaction."""
         pass
 
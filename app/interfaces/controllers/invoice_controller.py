@@ -1,6 +1,6 @@
 # interfaces/controller/invoice_controller.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from datetime import date
 from ...entities.user import User
@@ -41,6 +41,21 @@ class IInvoiceController(ABC):
         """Search and filter invoices."""
         pass
 
+    @abstractmethod
+    def stream_invoices(
+        self,
+        client_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        is_overdue: Optional[bool] = None,
+        current_user: User = None
+    ) -> AsyncIterator[bytes]:
+        """Search invoices, encoded as newline-delimited JSON."""
+        pass
+
     @abstractmethod
     async def update_invoice(
         self,
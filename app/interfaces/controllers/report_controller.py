@@ -1,17 +1,35 @@
 # interfaces/controller/report_controller.py
+from typing import Optional
 from abc import ABC, abstractmethod
 from uuid import UUID
 from io import BytesIO
 from ...entities.user import User
 
 class IReportController(ABC):
+    @abstractmethod
+    async def get_report_version(
+        self,
+        client_id: UUID,
+        current_user: User,
+        include_transactions: bool = True,
+        include_invoices: bool = True
+    ) -> str:
+        """
+        Get the version tag of a client's report, used as its ETag.
+
+        Raises:
+            HTTPException: If client not found or access denied
+        """
+        pass
+
     @abstractmethod
     async def generate_client_financial_report(
         self, 
         client_id: UUID, 
         current_user: User,
         include_transactions: bool = True,
-        include_invoices: bool = True
+        include_invoices: bool = True,
+        version: Optional[str] = None
     ) -> BytesIO:
         """
         Generate a financial report for a client.
@@ -21,11 +39,12 @@ class IReportController(ABC):
             current_user: Current authenticated user
             include_transactions: Whether to include transactions section
             include_invoices: Whether to include invoices section
+            version: Report version from get_report_version, enables reuse of a cached PDF
             
         Returns:
             BytesIO: PDF report buffer
             
         Raises:
-            HTTPException: If client not found or access denied
+            HTTPException: If client not found, access denied or the render rate limit is exceeded
         """
         pass
\ No newline at end of file
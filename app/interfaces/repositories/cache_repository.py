@@ -0,0 +1,71 @@
+# interfaces/repository/cache_repository.py
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+class ICacheRepository(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve a cached value.
+        
+        Args:
+            key: Cache key within the repository's namespace
+            
+        Returns:
+            Optional[Any]: The cached value or None on a miss
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store a JSON-serialisable value.
+        
+        Args:
+            key: Cache key within the repository's namespace
+            value: Value to cache
+            ttl: Expiry in seconds, defaults to the repository's TTL
+        """
+        pass
+
+    @abstractmethod
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """
+        Retrieve a cached binary value stored with set_bytes.
+        
+        Args:
+            key: Cache key within the repository's namespace
+            
+        Returns:
+            Optional[bytes]: The cached bytes or None on a miss
+        """
+        pass
+
+    @abstractmethod
+    async def set_bytes(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        """
+        Store a binary value as is, without JSON encoding.
+        
+        Args:
+            key: Cache key within the repository's namespace
+            value: Bytes to cache
+            ttl: Expiry in seconds, defaults to the repository's TTL
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Remove a cached value.
+        
+        Args:
+            key: Cache key within the repository's namespace
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Remove every value in the repository's namespace.
+        """
+        pass
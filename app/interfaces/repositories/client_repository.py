@@ -15,8 +15,8 @@ class IClientRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Client]:
-        """Get all clients with pagination."""
+    async def get_all(self, skip: int = 0, limit: int = 100, client_id: Optional[UUID] = None) -> List[Client]:
+        """Get all clients with pagination, optionally restricted to one client."""
         pass
     
     @abstractmethod
@@ -35,8 +35,8 @@ class IClientRepository(ABC):
         pass
     
     @abstractmethod
-    async def search_clients(self, search_term: str) -> List[Client]:
-        """Search clients by name or industry."""
+    async def search_clients(self, search_term: str, client_id: Optional[UUID] = None) -> List[Client]:
+        """Search clients by name or industry, optionally restricted to one client."""
         pass
 
     @abstractmethod
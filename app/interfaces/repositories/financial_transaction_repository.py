@@ -1,8 +1,8 @@
 # interfaces/repository/financial_transaction_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from ...entities.financial_transaction import FinancialTransaction
 
@@ -22,6 +22,11 @@ class IFinancialTransactionRepository(ABC):
         """Retrieve all financial transactions for a specific client."""
         pass
 
+    @abstractmethod
+    async def get_change_marker(self, client_id: UUID) -> Tuple[int, Optional[datetime]]:
+        """Count and latest update time of a client's transactions."""
+        pass
+
     @abstractmethod
     async def search_transactions(
         self,
@@ -35,6 +40,19 @@ class IFinancialTransactionRepository(ABC):
         """Search transactions with filters."""
         pass
 
+    @abstractmethod
+    def stream_transactions(
+        self,
+        client_id: Optional[UUID] = None,
+        category: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None
+    ) -> AsyncIterator[FinancialTransaction]:
+        """Iterate over transactions matching the search filters without loading them all."""
+        pass
+
     @abstractmethod
     async def get_transactions_by_date_range(
         self,
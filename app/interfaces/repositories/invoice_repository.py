@@ -1,8 +1,8 @@
 # interfaces/repository/invoice_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from ...entities.invoice import Invoice
 
@@ -41,6 +41,25 @@ class IInvoiceRepository(ABC):
         """Search invoices with filters."""
         pass
 
+    @abstractmethod
+    def stream(
+        self,
+        client_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        is_overdue: Optional[bool] = None
+    ) -> AsyncIterator[Invoice]:
+        """Iterate over invoices matching the search filters without loading them all."""
+        pass
+
+    @abstractmethod
+    async def get_change_marker(self, client_id: UUID) -> Tuple[int, Optional[datetime]]:
+        """Count and latest update time of a client's invoices."""
+        pass
+
     @abstractmethod
     async def get_overdue(self, client_id: Optional[UUID] = None) -> List[Invoice]:
         """Get overdue invoices."""
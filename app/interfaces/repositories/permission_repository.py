@@ -1,13 +1,14 @@
 # interfaces/repository/permission_repository.py
 from abc import ABC, abstractmethod
 from typing import Optional
+from uuid import UUID
 from ...entities.permission import Permission
 
 class IPermissionRepository(ABC):
     @abstractmethod
     async def get_permission(
         self, 
-        role_id: str, 
+        role_id: UUID, 
         resource: str, 
         action: str
     ) -> Optional[Permission]:
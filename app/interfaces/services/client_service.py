@@ -1,6 +1,6 @@
 # interfaces/service/client_service.py
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from ...schemas.dto.client_dto import ClientDTO
 from ...entities.user import User
@@ -17,13 +17,13 @@ class IClientService(ABC):
         pass
 
     @abstractmethod
-    async def get_all_clients(self, skip: int = 0, limit: int = 100) -> List[ClientDTO]:
-        """Get all clients with pagination."""
+    async def get_all_clients(self, skip: int = 0, limit: int = 100, client_id: Optional[UUID] = None) -> List[ClientDTO]:
+        """Get all clients with pagination, optionally restricted to one client."""
         pass
     
     @abstractmethod
-    async def search_clients(self, search_term: str) -> List[ClientDTO]:
-        """Search clients by name or industry"""
+    async def search_clients(self, search_term: str, client_id: Optional[UUID] = None) -> List[ClientDTO]:
+        """Search clients by name or industry, optionally restricted to one client."""
         pass
     
     @abstractmethod
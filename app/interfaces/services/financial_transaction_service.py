@@ -1,6 +1,6 @@
 # interfaces/service/financial_transaction_service.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from datetime import date
 from ...entities.user import User
@@ -30,6 +30,19 @@ class IFinancialTransactionService(ABC):
         """Search transactions with filters."""
         pass
 
+    @abstractmethod
+    def stream_transactions(
+        self,
+        client_id: Optional[UUID] = None,
+        category: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None
+    ) -> AsyncIterator[TransactionDTO]:
+        """Stream transactions matching the search filters."""
+        pass
+
     @abstractmethod
     async def update_transaction(self, transaction_dto: TransactionDTO, current_user: User) -> TransactionDTO:
         """Update an existing transaction."""
@@ -1,6 +1,6 @@
 # interfaces/service/invoice_service.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from datetime import date
 from decimal import Decimal
@@ -32,6 +32,20 @@ class IInvoiceService(ABC):
         """Search invoices with filters."""
         pass
 
+    @abstractmethod
+    def stream_invoices(
+        self,
+        client_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        is_overdue: Optional[bool] = None
+    ) -> AsyncIterator[InvoiceDTO]:
+        """Stream invoices matching the search filters."""
+        pass
+
     @abstractmethod
     async def update_invoice(self, invoice_dto: InvoiceDTO, current_user: User) -> InvoiceDTO:
         """Update an existing invoice."""
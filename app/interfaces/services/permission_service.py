@@ -1,13 +1,14 @@
 # interfaces/service/permission_service.py
 from abc import ABC, abstractmethod
 from typing import Optional
+from uuid import UUID
 from ...entities.permission import Permission
 
 class IPermissionService(ABC):
     @abstractmethod
     async def check_permission(
         self, 
-        role_id: str, 
+        role_id: UUID, 
         resource: str, 
         action: str
     ) -> bool:
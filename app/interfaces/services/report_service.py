@@ -5,6 +5,21 @@ from io import BytesIO
 
 class IReportService(ABC):
     
+    @abstractmethod
+    async def get_report_version(
+        self,
+        client_id: UUID,
+        include_transactions: bool = True,
+        include_invoices: bool = True
+    ) -> str:
+        """
+        Get a tag that changes whenever the data behind a client's report does.
+
+        Raises:
+            ValueError: If client not found
+        """
+        pass
+
     @abstractmethod
     async def generate_client_financial_report(
         self, 
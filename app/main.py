@@ -1,10 +1,16 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse
-from app.config import settings
+from fastapi.responses import ORJSONResponse, Response
+from app.config import get_settings
 from app.container import Container
+from app.db import SessionScopeMiddleware
+from app.utils.redis_config import open_redis, close_redis
+from app.utils.http_errors import StaticHTTPException
 from app.routes import auth_route, client_route, financial_transaction_route, invoice_route
 
+settings = get_settings()
+
 # Create and configure the container
 container = Container()
 container.config.from_dict({
@@ -14,10 +20,22 @@ container.config.from_dict({
     "access_token_expire_minutes": settings.access_token_expire_minutes,
 })
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open and close long-lived resources (Redis pool) with the app
+    container.init_resources()
+    await open_redis(container.redis(), settings.redis_min_idle_conns)
+    yield
+    await close_redis(container.redis())
+    container.shutdown_resources()
+
 # Initialize the FastAPI app
 app = FastAPI(
     title="Financial Management API",
-    description="API for managing clients, invoices, and financial transactions"
+    description="API for managing clients, invoices, and financial transactions",
+    lifespan=lifespan,
+    # orjson natively encodes the UUIDs and dates the list endpoints are full of
+    default_response_class=ORJSONResponse
 )
 
 # Store container in app instance
@@ -32,6 +50,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Close the per-request database session
+app.add_middleware(SessionScopeMiddleware, session_provider=container.db)
+
 # Include routes
 app.include_router(auth_route.router, prefix="/auth", tags=["Authentication"])
 app.include_router(client_route.router, prefix="/clients", tags=["Clients"])
@@ -51,10 +72,20 @@ def version():
         "changelog": "Added container for DI and IoC"
     }
 
+# Static errors arrive with their JSON body already encoded
+@app.exception_handler(StaticHTTPException)
+def static_http_exception_handler(request, exc: StaticHTTPException):
+    return Response(
+        content=exc.body,
+        status_code=exc.status_code,
+        headers=exc.headers,
+        media_type="application/json"
+    )
+
 # Error handler for Problem Details
 @app.exception_handler(Exception)
 def problem_details_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "title": "Internal Server Error",
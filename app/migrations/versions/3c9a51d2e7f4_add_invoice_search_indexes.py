@@ -0,0 +1,32 @@
+"""add_invoice_search_indexes
+
+Revision ID: 3c9a51d2e7f4
+Revises: 94e764b0620e
+Create Date: 2026-10-16 14:03:27.118402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9a51d2e7f4'
+down_revision: Union[str, None] = '94e764b0620e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_invoices_client_date', 'invoices', ['client_id', 'invoice_date'], unique=False)
+    op.create_index('ix_invoices_client_status', 'invoices', ['client_id', 'status'], unique=False)
+    op.create_index('ix_invoices_unpaid_due', 'invoices', ['due_date', 'client_id'], unique=False, postgresql_where=sa.text("status <> 'PAID'"))
+    op.create_index('ix_ft_client_category', 'financial_transactions', ['client_id', 'category'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ft_client_category', table_name='financial_transactions')
+    op.drop_index('ix_invoices_unpaid_due', table_name='invoices', postgresql_where=sa.text("status <> 'PAID'"))
+    op.drop_index('ix_invoices_client_status', table_name='invoices')
+    op.drop_index('ix_invoices_client_date', table_name='invoices')
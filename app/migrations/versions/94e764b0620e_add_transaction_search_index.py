@@ -0,0 +1,25 @@
+"""add_transaction_search_index
+
+Revision ID: 94e764b0620e
+Revises: 758f8d00eac7
+Create Date: 2026-10-16 10:12:41.508214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '94e764b0620e'
+down_revision: Union[str, None] = '758f8d00eac7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_ft_client_date_cat', 'financial_transactions', ['client_id', 'transaction_date', 'category'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ft_client_date_cat', table_name='financial_transactions')
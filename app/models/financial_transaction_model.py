@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, DECIMAL, Date
+from sqlalchemy import Column, String, DateTime, ForeignKey, DECIMAL, Date, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -7,6 +7,12 @@ from ..db import Base
 
 class FinancialTransaction(Base):
     __tablename__ = 'financial_transactions'
+    __table_args__ = (
+        # Backs transaction search: client first, then the date range, then category
+        Index('ix_ft_client_date_cat', 'client_id', 'transaction_date', 'category'),
+        # Backs category filters without a date range, which the index above can't narrow
+        Index('ix_ft_client_category', 'client_id', 'category'),
+    )
     
     id = Column(UUID, primary_key=True, index=True, default=uuid.uuid4)
     client_id = Column(UUID, ForeignKey('clients.id'))
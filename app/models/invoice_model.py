@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, DECIMAL, Date
+from sqlalchemy import Column, String, DateTime, ForeignKey, DECIMAL, Date, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -7,6 +7,14 @@ from ..db import Base
 
 class Invoice(Base):
     __tablename__ = 'invoices'
+    __table_args__ = (
+        # Backs invoice search: client first, then the invoice date range
+        Index('ix_invoices_client_date', 'client_id', 'invoice_date'),
+        # Backs the status filter, which client users apply within their own invoices
+        Index('ix_invoices_client_status', 'client_id', 'status'),
+        # Backs the overdue listing; only unpaid invoices can ever be overdue
+        Index('ix_invoices_unpaid_due', 'due_date', 'client_id', postgresql_where=text("status <> 'PAID'")),
+    )
     
     id = Column(UUID, primary_key=True, index=True, default=uuid.uuid4)
     client_id = Column(UUID, ForeignKey('clients.id'))
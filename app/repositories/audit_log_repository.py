@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..interfaces.repositories.audit_log_repository import IAuditLogRepository
 from ..models.audit_logs_model import AuditLog as AuditLogModel
@@ -9,7 +9,7 @@ class AuditLogRepository(IAuditLogRepository):
     Repository for AuditLog-specific database operations.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize repository with database session."""
         self.db = db
 
@@ -42,8 +42,8 @@ class AuditLogRepository(IAuditLogRepository):
         try:
             model = self._to_model(entity)
             self.db.add(model)
-            self.db.commit()
-            self.db.refresh(model)
+            await self.db.commit()
+            # id and timestamp are generated client-side, so the flushed model is already complete
             return self._to_entity(model)
         except Exception as e:
             await self.db.rollback()
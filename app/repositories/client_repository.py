@@ -1,17 +1,24 @@
 from typing import List, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import select, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..db import prebuilt
 from ..models.client_model import Client as ClientModel
 from ..entities.client import Client
 from ..interfaces.repositories.client_repository import IClientRepository
 
+# Fixed-shape lookups, built once and reused across requests
+BY_NAME = prebuilt(select(ClientModel).filter(ClientModel.name == bindparam("name")))
+BY_EMAIL = prebuilt(select(ClientModel).filter(ClientModel.contact_email == bindparam("email")))
+BY_INDUSTRY = prebuilt(select(ClientModel).filter(ClientModel.industry == bindparam("industry")))
+
 class ClientRepository(IClientRepository):
     """
     Repository for Client-specific database operations.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize repository with database session."""
         self.db = db
 
@@ -46,8 +53,8 @@ class ClientRepository(IClientRepository):
         try:
             model = self._to_model(entity)
             self.db.add(model)
-            self.db.commit()
-            self.db.refresh(model)
+            await self.db.commit()
+            await self.db.refresh(model)
             return self._to_entity(model)
         except Exception as e:
             await self.db.rollback()
@@ -55,12 +62,15 @@ class ClientRepository(IClientRepository):
     
     async def get_by_id(self, client_id: UUID) -> Optional[Client]:
         """Get a client by its ID from the database."""
-        model = self.db.query(ClientModel).filter(ClientModel.id == client_id).first()
+        model = await self.db.get(ClientModel, client_id)
         return self._to_entity(model) if model else None
         
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Client]:
-        """Get all clients with pagination"""
-        models = self.db.query(ClientModel).offset(skip).limit(limit).all()
+    async def get_all(self, skip: int = 0, limit: int = 100, client_id: Optional[UUID] = None) -> List[Client]:
+        """Get all clients with pagination, optionally restricted to a single client"""
+        query = select(ClientModel)
+        if client_id is not None:
+            query = query.filter(ClientModel.id == client_id)
+        models = (await self.db.scalars(query.offset(skip).limit(limit))).all()
         return [self._to_entity(model) for model in models]
     
     async def get_client_by_name(self, name: str) -> Optional[Client]:
@@ -73,7 +83,7 @@ class ClientRepository(IClientRepository):
         Returns:
             Optional[Client]: Found client or None
         """
-        model = self.db.query(ClientModel).filter(ClientModel.name == name).first()
+        model = await self.db.scalar(BY_NAME, {"name": name})
         return self._to_entity(model) if model else None
     
     async def get_client_by_email(self, email: str) -> Optional[Client]:
@@ -86,7 +96,7 @@ class ClientRepository(IClientRepository):
         Returns:
             Optional[Client]: Found client or None
         """
-        model = self.db.query(ClientModel).filter(ClientModel.contact_email == email).first()
+        model = await self.db.scalar(BY_EMAIL, {"email": email})
         return self._to_entity(model) if model else None
     
     async def get_clients_by_industry(self, industry: str) -> List[Client]:
@@ -99,34 +109,39 @@ class ClientRepository(IClientRepository):
         Returns:
             List[Client]: List of clients in the industry
         """
-        models = self.db.query(ClientModel).filter(ClientModel.industry == industry).all()
+        models = (await self.db.scalars(BY_INDUSTRY, {"industry": industry})).all()
         return [self._to_entity(model) for model in models]
 
-    async def search_clients(self, search_term: str) -> List[Client]:
+    async def search_clients(self, search_term: str, client_id: Optional[UUID] = None) -> List[Client]:
         """
         Search clients by name or industry.
         
         Args:
             search_term: Term to search for
+            client_id: Optional client to restrict the search to
             
         Returns:
             List[Client]: List of matching clients
         """
-        models = self.db.query(ClientModel)\
+        query = select(ClientModel)\
             .filter(
                 (ClientModel.name.ilike(f"%{search_term}%")) |
                 (ClientModel.industry.ilike(f"%{search_term}%"))
-            ).all()
+            )
+        if client_id is not None:
+            query = query.filter(ClientModel.id == client_id)
+        models = (await self.db.scalars(query)).all()
         return [self._to_entity(model) for model in models]
     
     async def update(self, entity: Client) -> Client:
         """Update an existing client"""
         try:
             model = self._to_model(entity)
-            self.db.merge(model)
-            self.db.commit()
+            updated_model = await self.db.merge(model)
+            await self.db.commit()
 
-            updated_model = self.db.query(ClientModel).filter(ClientModel.id == entity.id).first()
+            # Refresh and return updated entity
+            await self.db.refresh(updated_model)
             return self._to_entity(updated_model)
         except Exception as e:
             await self.db.rollback()
@@ -135,10 +150,10 @@ class ClientRepository(IClientRepository):
     async def delete(self, client_id: UUID) -> None:
         """Delete a client by ID"""
         try:
-            model = self.db.query(ClientModel).filter(ClientModel.id == client_id).first()
+            model = await self.db.get(ClientModel, client_id)
             if model:
-                self.db.delete(model)
-                self.db.commit()
+                await self.db.delete(model)
+                await self.db.commit()
         except Exception as e:
             await self.db.rollback()
             raise ValueError(f"Error deleting client: {str(e)}")
@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
-from datetime import date
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime
 
 from ..interfaces.repositories.financial_transaction_repository import IFinancialTransactionRepository
 from ..models.financial_transaction_model import FinancialTransaction as FinancialTransactionModel
@@ -11,9 +12,13 @@ class FinancialTransactionRepository(IFinancialTransactionRepository):
     """Repository for handling financial transaction database operations.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize repository with database session."""
         self.db = db
+        # The session's identity map only holds weak references, so rows loaded by get_by_id
+        # are pinned here for the request; the update/delete that usually follows then
+        # resolves them from the identity map instead of selecting them again
+        self._loaded: Dict[UUID, FinancialTransactionModel] = {}
 
     def _to_model(self, entity: FinancialTransaction) -> FinancialTransactionModel:
         """Convert entity to model."""
@@ -31,7 +36,7 @@ class FinancialTransactionRepository(IFinancialTransactionRepository):
     
     def _to_entity(self, model:FinancialTransactionModel) -> FinancialTransaction:
         """Convert model to entity."""
-        return FinancialTransaction(
+        return FinancialTransaction.from_trusted(
             id=model.id,
             client_id=model.client_id,
             created_by=model.created_by,
@@ -48,18 +53,36 @@ class FinancialTransactionRepository(IFinancialTransactionRepository):
         try:
             model = self._to_model(entity)
             self.db.add(model)
-            self.db.commit()
-            self.db.refresh(model)
+            await self.db.commit()
+            await self.db.refresh(model)
             return self._to_entity(model)
         except Exception as e:
             await self.db.rollback()
             raise ValueError(f"Error creating financial transaction: {str(e)}")
         
     async def get_by_id(self, id: UUID) -> Optional[FinancialTransaction]:
-        """Get a financial transaction by ID."""
-        model = self.db.query(FinancialTransactionModel).filter(FinancialTransactionModel.id == id).first()
-        return self._to_entity(model) if model else None
+        """Get a financial transaction by ID (served from the session's identity map when already loaded)."""
+        model = await self.db.get(FinancialTransactionModel, id)
+        if model is None:
+            return None
+        self._loaded[id] = model
+        return self._to_entity(model)
     
+    async def get_change_marker(self, client_id: UUID) -> Tuple[int, Optional[datetime]]:
+        """Count and latest update time of a client's transactions, which change whenever any of them do.
+
+        Args:
+            client_id (UUID): The unique identifier of the client
+
+        Returns:
+            Tuple[int, Optional[datetime]]: Number of transactions and the most recent updated_at
+        """
+        result = await self.db.execute(
+            select(func.count(), func.max(FinancialTransactionModel.updated_at))
+            .filter(FinancialTransactionModel.client_id == client_id)
+        )
+        return tuple(result.one())
+
     async def get_by_client_id(self, client_id: UUID, skip: int = 0, limit: int = 100) -> List[FinancialTransaction]:
         """Retrieve all financial transactions for a specific client.
 
@@ -71,13 +94,43 @@ class FinancialTransactionRepository(IFinancialTransactionRepository):
         Returns:
             List[FinancialTransaction]: List of financial transactions for the specified client
         """
-        models = self.db.query(FinancialTransactionModel)\
+        query = select(FinancialTransactionModel)\
             .filter(FinancialTransactionModel.client_id == client_id)\
             .offset(skip)\
-            .limit(limit)\
-            .all()
+            .limit(limit)
+        models = (await self.db.scalars(query)).all()
         return [self._to_entity(model) for model in models]
 
+    def _search_query(self,
+                      client_id: Optional[UUID] = None,
+                      category: Optional[str] = None,
+                      start_date: Optional[date] = None,
+                      end_date: Optional[date] = None,
+                      min_amount: Optional[float] = None,
+                      max_amount: Optional[float] = None) -> Select:
+        """Build the filtered transaction query shared by search and stream."""
+        query = select(FinancialTransactionModel)
+        
+        if client_id:
+            query = query.filter(FinancialTransactionModel.client_id == client_id)
+            
+        if category:
+            query = query.filter(FinancialTransactionModel.category == category)
+            
+        if start_date:
+            query = query.filter(FinancialTransactionModel.transaction_date >= start_date)
+            
+        if end_date:
+            query = query.filter(FinancialTransactionModel.transaction_date <= end_date)
+            
+        if min_amount is not None:
+            query = query.filter(FinancialTransactionModel.amount >= min_amount)
+            
+        if max_amount is not None:
+            query = query.filter(FinancialTransactionModel.amount <= max_amount)
+
+        return query
+
     async def search_transactions(self, 
                         client_id: Optional[UUID] = None,
                         category: Optional[str] = None,
@@ -98,29 +151,26 @@ class FinancialTransactionRepository(IFinancialTransactionRepository):
         Returns:
             List[FinancialTransaction]: List of transactions matching the specified criteria
         """
-        query = self.db.query(FinancialTransactionModel)
-        
-        if client_id:
-            query = query.filter(FinancialTransactionModel.client_id == client_id)
-            
-        if category:
-            query = query.filter(FinancialTransactionModel.category == category)
-            
-        if start_date:
-            query = query.filter(FinancialTransactionModel.transaction_date >= start_date)
-            
-        if end_date:
-            query = query.filter(FinancialTransactionModel.transaction_date <= end_date)
-            
-        if min_amount is not None:
-            query = query.filter(FinancialTransactionModel.amount >= min_amount)
-            
-        if max_amount is not None:
-            query = query.filter(FinancialTransactionModel.amount <= max_amount)
-            
-        models = query.all()
+        query = self._search_query(client_id, category, start_date, end_date, min_amount, max_amount)
+        models = (await self.db.scalars(query)).all()
         return [self._to_entity(model) for model in models]
 
+    async def stream_transactions(self,
+                        client_id: Optional[UUID] = None,
+                        category: Optional[str] = None,
+                        start_date: Optional[date] = None,
+                        end_date: Optional[date] = None,
+                        min_amount: Optional[float] = None,
+                        max_amount: Optional[float] = None) -> AsyncIterator[FinancialTransaction]:
+        """Yield transactions matching the same filters as search_transactions, one row at a time.
+
+        Rows are read through a server-side cursor, so memory stays flat however many match.
+        """
+        query = self._search_query(client_id, category, start_date, end_date, min_amount, max_amount)
+        result = await self.db.stream_scalars(query.execution_options(yield_per=500))
+        async for model in result:
+            yield self._to_entity(model)
+
     async def get_transactions_by_date_range(self, start_date: date, end_date: date) -> List[FinancialTransaction]:
         """Retrieve transactions within a specific date range.
 
@@ -131,9 +181,9 @@ class FinancialTransactionRepository(IFinancialTransactionRepository):
         Returns:
             List[FinancialTransaction]: List of transactions within the specified date range
         """
-        models = self.db.query(FinancialTransactionModel)\
-            .filter(FinancialTransactionModel.transaction_date.between(start_date, end_date))\
-            .all()
+        query = select(FinancialTransactionModel)\
+            .filter(FinancialTransactionModel.transaction_date.between(start_date, end_date))
+        models = (await self.db.scalars(query)).all()
         return [self._to_entity(model) for model in models]
 
     async def get_transactions_by_category(self, category: str) -> List[FinancialTransaction]:
@@ -145,20 +195,20 @@ class FinancialTransactionRepository(IFinancialTransactionRepository):
         Returns:
             List[FinancialTransaction]: List of transactions in the specified category
         """
-        models = self.db.query(FinancialTransactionModel)\
-            .filter(FinancialTransactionModel.category == category)\
-            .all()
+        query = select(FinancialTransactionModel)\
+            .filter(FinancialTransactionModel.category == category)
+        models = (await self.db.scalars(query)).all()
         return [self._to_entity(model) for model in models]
     
     async def update(self, entity: FinancialTransaction) -> FinancialTransaction:
         """Update an existing financial transaction."""
         try:
             model = self._to_model(entity)
-            self.db.merge(model)
-            self.db.commit()
-            
+            updated_model = await self.db.merge(model)
+            await self.db.commit()
+
             # Refresh and return updated entity
-            updated_model = self.db.query(FinancialTransactionModel).filter(FinancialTransactionModel.id == entity.id).first()
+            await self.db.refresh(updated_model)
             return self._to_entity(updated_model)
         except Exception as e:
             await self.db.rollback()
@@ -167,10 +217,11 @@ class FinancialTransactionRepository(IFinancialTransactionRepository):
     async def delete(self, id: UUID) -> None:
         """Delete a financial transaction."""
         try:
-            model = self.db.query(FinancialTransactionModel).filter(FinancialTransactionModel.id == id).first()
+            # The service has usually just loaded this row, so this is an identity map hit
+            model = await self.db.get(FinancialTransactionModel, id)
             if model:
-                self.db.delete(model)
-                self.db.commit()
+                await self.db.delete(model)
+                await self.db.commit()
         except Exception as e:
             await self.db.rollback()
             raise ValueError(f"Error deleting financial transaction: {str(e)}")
\ No newline at end of file
@@ -1,20 +1,58 @@
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from datetime import date
+from sqlalchemy import Select, bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, literal, or_
+from datetime import date, datetime
 from decimal import Decimal
 
 from ..interfaces.repositories.invoice_repository import IInvoiceRepository
 from ..models.invoice_model import Invoice as InvoiceModel
 from ..entities.invoice import Invoice, InvoiceStatus
+from ..db import prebuilt
+from ..utils.clock import today
+
+# Rendered inline rather than bound so the planner can match the partial ix_invoices_unpaid_due index
+UNPAID = InvoiceModel.status != literal(InvoiceStatus.PAID.value, literal_execute=True)
+
+@lru_cache(maxsize=None)
+def _search_statement(client_id: bool, status: bool, start_date: bool, end_date: bool,
+                      min_amount: bool, max_amount: bool, is_overdue: Optional[bool]) -> Select:
+    """Search query for one combination of active filters, values left as bindparams.
+
+    There are at most 2**6 * 3 shapes, each built once and then reused with its memoized cache key.
+    """
+    query = select(InvoiceModel)
+    if client_id:
+        query = query.filter(InvoiceModel.client_id == bindparam("client_id"))
+    if status:
+        query = query.filter(InvoiceModel.status == bindparam("status"))
+    if start_date:
+        query = query.filter(InvoiceModel.invoice_date >= bindparam("start_date"))
+    if end_date:
+        query = query.filter(InvoiceModel.invoice_date <= bindparam("end_date"))
+    if min_amount:
+        query = query.filter(InvoiceModel.amount_due >= bindparam("min_amount"))
+    if max_amount:
+        query = query.filter(InvoiceModel.amount_due <= bindparam("max_amount"))
+    if is_overdue:
+        query = query.filter(and_(InvoiceModel.due_date < bindparam("today"), UNPAID))
+    elif is_overdue is not None:
+        # Exactly the complement of Invoice.is_overdue()
+        query = query.filter(or_(InvoiceModel.due_date >= bindparam("today"), ~UNPAID))
+    return prebuilt(query)
 
 class InvoiceRepository(IInvoiceRepository):
     """Repository for Invoice specific database operations."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize repository with database session."""
         self.db = db
+        # The session's identity map only holds weak references, so rows loaded by get_by_id
+        # are pinned here for the request; the update/delete that usually follows then
+        # resolves them from the identity map instead of selecting them again
+        self._loaded: Dict[UUID, InvoiceModel] = {}
 
     def _to_model(self, entity: Invoice) -> InvoiceModel:
         """Convert domain entity to database model."""
@@ -33,7 +71,7 @@ class InvoiceRepository(IInvoiceRepository):
 
     def _to_entity(self, model: InvoiceModel) -> Invoice:
         """Convert database model to domain entity."""
-        return Invoice(
+        return Invoice.from_trusted(
             id=model.id,
             client_id=model.client_id,
             created_by=model.created_by,
@@ -41,7 +79,6 @@ class InvoiceRepository(IInvoiceRepository):
             due_date=model.due_date,
             amount_due=model.amount_due,
             amount_paid=model.amount_paid,
-            status=model.status,
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -51,27 +88,30 @@ class InvoiceRepository(IInvoiceRepository):
         try:
             model = self._to_model(entity)
             self.db.add(model)
-            self.db.commit()
-            self.db.refresh(model)
+            await self.db.commit()
+            await self.db.refresh(model)
             return self._to_entity(model)
         except Exception as e:
             await self.db.rollback()
             raise ValueError(f"Error creating invoice: {str(e)}")
 
     async def get_by_id(self, invoice_id: UUID) -> Optional[Invoice]:
-        """Get an invoice by ID."""
-        model = self.db.query(InvoiceModel).filter(InvoiceModel.id == invoice_id).first()
-        return self._to_entity(model) if model else None
+        """Get an invoice by ID (served from the session's identity map when already loaded)."""
+        model = await self.db.get(InvoiceModel, invoice_id)
+        if model is None:
+            return None
+        self._loaded[invoice_id] = model
+        return self._to_entity(model)
 
     async def update(self, entity: Invoice) -> Invoice:
         """Update an existing invoice."""
         try:
             model = self._to_model(entity)
-            self.db.merge(model)
-            self.db.commit()
-            
+            updated_model = await self.db.merge(model)
+            await self.db.commit()
+
             # Refresh and return updated entity
-            updated_model = self.db.query(InvoiceModel).filter(InvoiceModel.id == entity.id).first()
+            await self.db.refresh(updated_model)
             return self._to_entity(updated_model)
         except Exception as e:
             await self.db.rollback()
@@ -80,15 +120,16 @@ class InvoiceRepository(IInvoiceRepository):
     async def delete(self, invoice_id: UUID) -> None:
         """Delete an invoice."""
         try:
-            model = self.db.query(InvoiceModel).filter(InvoiceModel.id == invoice_id).first()
+            # The service has usually just loaded this row, so this is an identity map hit
+            model = await self.db.get(InvoiceModel, invoice_id)
             if model:
-                self.db.delete(model)
-                self.db.commit()
+                await self.db.delete(model)
+                await self.db.commit()
         except Exception as e:
             await self.db.rollback()
             raise ValueError(f"Error deleting invoice: {str(e)}")
 
-    async def search(
+    def _search_query(
         self,
         client_id: Optional[UUID] = None,
         status: Optional[str] = None,
@@ -97,46 +138,82 @@ class InvoiceRepository(IInvoiceRepository):
         min_amount: Optional[Decimal] = None,
         max_amount: Optional[Decimal] = None,
         is_overdue: Optional[bool] = None
-    ) -> List[Invoice]:
-        """Search invoices with filters."""
-        query = self.db.query(InvoiceModel)
-        
+    ) -> Tuple[Select, Dict[str, Any]]:
+        """Pick the prebuilt query shared by search and stream, and the values for its bindparams."""
+        params = {}
         if client_id:
-            query = query.filter(InvoiceModel.client_id == client_id)
+            params["client_id"] = client_id
         if status:
-            query = query.filter(InvoiceModel.status == status)
+            params["status"] = status
         if start_date:
-            query = query.filter(InvoiceModel.invoice_date >= start_date)
+            params["start_date"] = start_date
         if end_date:
-            query = query.filter(InvoiceModel.invoice_date <= end_date)
+            params["end_date"] = end_date
         if min_amount is not None:
-            query = query.filter(InvoiceModel.amount_due >= min_amount)
+            params["min_amount"] = min_amount
         if max_amount is not None:
-            query = query.filter(InvoiceModel.amount_due <= max_amount)
-        if is_overdue:
-            current_date = date.today()
-            query = query.filter(and_(
-                InvoiceModel.due_date < current_date,
-                InvoiceModel.status != InvoiceStatus.PAID
-            ))
-
-        models = query.all()
+            params["max_amount"] = max_amount
+        if is_overdue is not None:
+            params["today"] = today()
+
+        query = _search_statement(
+            "client_id" in params, "status" in params, "start_date" in params, "end_date" in params,
+            "min_amount" in params, "max_amount" in params, is_overdue
+        )
+        return query, params
+
+    async def search(
+        self,
+        client_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        is_overdue: Optional[bool] = None
+    ) -> List[Invoice]:
+        """Search invoices with filters."""
+        query, params = self._search_query(client_id, status, start_date, end_date, min_amount, max_amount, is_overdue)
+        models = (await self.db.scalars(query, params)).all()
         return [self._to_entity(model) for model in models]
 
+    async def stream(
+        self,
+        client_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        is_overdue: Optional[bool] = None
+    ) -> AsyncIterator[Invoice]:
+        """Yield invoices matching the same filters as search, reading rows through a server-side cursor."""
+        query, params = self._search_query(client_id, status, start_date, end_date, min_amount, max_amount, is_overdue)
+        result = await self.db.stream_scalars(query, params, execution_options={"yield_per": 500})
+        async for model in result:
+            yield self._to_entity(model)
+
     async def get_overdue(self, client_id: Optional[UUID] = None) -> List[Invoice]:
         """Get overdue invoices."""
-        query = self.db.query(InvoiceModel).filter(and_(
-            InvoiceModel.due_date < date.today(),
-            InvoiceModel.status != InvoiceStatus.PAID
+        query = select(InvoiceModel).filter(and_(
+            InvoiceModel.due_date < today(),
+            UNPAID
         ))
 
         if client_id:
             query = query.filter(InvoiceModel.client_id == client_id)
 
-        models = query.all()
+        models = (await self.db.scalars(query)).all()
         return [self._to_entity(model) for model in models]
     
+    async def get_change_marker(self, client_id: UUID) -> Tuple[int, Optional[datetime]]:
+        """Count and latest update time of a client's invoices, which change whenever any of them do."""
+        result = await self.db.execute(
+            select(func.count(), func.max(InvoiceModel.updated_at)).filter(InvoiceModel.client_id == client_id)
+        )
+        return tuple(result.one())
+
     async def get_by_client_id(self, client_id: UUID) -> List[Invoice]:
         """Get all invoices for a specific client."""
-        models = self.db.query(InvoiceModel).filter(InvoiceModel.client_id == client_id).all()
+        models = (await self.db.scalars(select(InvoiceModel).filter(InvoiceModel.client_id == client_id))).all()
         return [self._to_entity(model) for model in models]
\ No newline at end of file
@@ -0,0 +1,34 @@
+from typing import Any, Optional
+
+from ..interfaces.repositories.cache_repository import ICacheRepository
+
+class NullCacheRepository(ICacheRepository):
+    """
+    Cache repository used when Redis is not configured.
+
+    Every lookup is a miss and writes are dropped, so callers need no
+    special casing for a disabled cache.
+    """
+    async def get(self, key: str) -> Optional[Any]:
+        """Always a miss."""
+        return None
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Drop the value."""
+        pass
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Always a miss."""
+        return None
+
+    async def set_bytes(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        """Drop the value."""
+        pass
+
+    async def delete(self, key: str) -> None:
+        """Nothing to remove."""
+        pass
+
+    async def clear(self) -> None:
+        """Nothing to remove."""
+        pass
@@ -1,5 +1,7 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..interfaces.repositories.permission_repository import IPermissionRepository
 from ..models.permission_model import Permission as PermissionModel
@@ -9,7 +11,7 @@ class PermissionRepository(IPermissionRepository):
     """
     Repository for handling permission-related CRUD operations.
     """
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize repository with db session."""
         self.db = db
 
@@ -35,7 +37,7 @@ class PermissionRepository(IPermissionRepository):
             updated_at=model.updated_at
         )
 
-    async def get_permission(self, role_id: str, resource: str, action: str) -> Optional[Permission]:
+    async def get_permission(self, role_id: UUID, resource: str, action: str) -> Optional[Permission]:
         """
         Retrieve a specific permission by role_id, resource, and action.
         
@@ -47,5 +49,5 @@ class PermissionRepository(IPermissionRepository):
         Returns:
             Optional[Permission]: The permission object or None
         """
-        model = self.db.query(PermissionModel).filter_by(role_id=role_id, resource=resource, action=action).first()
+        model = await self.db.scalar(select(PermissionModel).filter_by(role_id=role_id, resource=resource, action=action))
         return self._to_entity(model) if model else None
\ No newline at end of file
@@ -0,0 +1,73 @@
+import orjson
+from typing import Any, Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from ..interfaces.repositories.cache_repository import ICacheRepository
+
+class RedisCacheRepository(ICacheRepository):
+    """
+    Repository caching JSON values (encoded with orjson) in Redis under a key namespace.
+
+    Holds no per-request state, only the shared pooled client, so a single
+    instance per namespace serves the whole process. Redis errors are
+    treated as cache misses.
+    """
+    def __init__(self, redis: Redis, namespace: str, default_ttl: int):
+        """Initialize repository with the pooled Redis client."""
+        self.redis = redis
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+
+    def _key(self, key: str) -> str:
+        """Prefix key with the repository namespace."""
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Retrieve a cached value, None on a miss."""
+        try:
+            raw = await self.redis.get(self._key(key))
+        except RedisError:
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value for ttl seconds (repository default when omitted)."""
+        try:
+            await self.redis.set(
+                self._key(key),
+                orjson.dumps(value, default=str),
+                ex=ttl or self.default_ttl
+            )
+        except RedisError:
+            pass
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Retrieve cached bytes, None on a miss."""
+        try:
+            return await self.redis.get(self._key(key))
+        except RedisError:
+            return None
+
+    async def set_bytes(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        """Store bytes for ttl seconds (repository default when omitted)."""
+        try:
+            await self.redis.set(self._key(key), value, ex=ttl or self.default_ttl)
+        except RedisError:
+            pass
+
+    async def delete(self, key: str) -> None:
+        """Remove a cached value."""
+        try:
+            await self.redis.delete(self._key(key))
+        except RedisError:
+            pass
+
+    async def clear(self) -> None:
+        """Remove every value in the namespace (SCAN, so Redis is never blocked)."""
+        try:
+            keys = [key async for key in self.redis.scan_iter(match=self._key("*"), count=500)]
+            if keys:
+                await self.redis.unlink(*keys)
+        except RedisError:
+            pass
@@ -1,16 +1,32 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from uuid import UUID
 
 from ..interfaces.repositories.user_repository import IUserRepository
+from ..db import prebuilt
 from ..models.user_model import User as UserModel
+from ..models.role_model import Role as RoleModel
 from ..entities.user import User
 
+# Users carry their role and its permissions, which can't lazy load on an AsyncSession.
+# The role rides along in the user query's JOIN; permissions follow in one IN query.
+WITH_ROLE = joinedload(UserModel.role).selectinload(RoleModel.permissions)
+
+# Fixed-shape lookups, built once and reused across requests (by id runs on every authenticated request)
+BY_ID = prebuilt(select(UserModel).options(WITH_ROLE).filter(UserModel.id == bindparam("id")))
+BY_USERNAME = prebuilt(select(UserModel).options(WITH_ROLE).filter(UserModel.username == bindparam("username")))
+BY_EMAIL = prebuilt(select(UserModel).options(WITH_ROLE).filter(UserModel.email == bindparam("email")))
+
+# Reloads a user just written through the session, replacing whatever role it held
+RELOAD_BY_ID = BY_ID.execution_options(populate_existing=True)
+
 class UserRepository(IUserRepository):
     """
     Repository for User-specific database operations.
     """
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize repository with db session."""
         self.db = db
 
@@ -43,7 +59,7 @@ class UserRepository(IUserRepository):
     
     async def get_by_id(self, id:UUID) -> Optional[User]:
         """Get user by id."""
-        model = self.db.query(UserModel).filter(UserModel.id == id).first()
+        model = await self.db.scalar(BY_ID, {"id": id})
         return self._to_entity(model) if model else None
     
     async def get_by_username(self, username: str) -> Optional[User]:
@@ -56,7 +72,7 @@ class UserRepository(IUserRepository):
         Returns:
             Optional[User]: Found user or None
         """
-        model = self.db.query(UserModel).filter(UserModel.username == username).first()
+        model = await self.db.scalar(BY_USERNAME, {"username": username})
         return self._to_entity(model) if model else None
 
     async def get_by_email(self, email: str) -> Optional[User]:
@@ -69,7 +85,7 @@ class UserRepository(IUserRepository):
         Returns:
             Optional[User]: Found user or None
         """
-        model = self.db.query(UserModel).filter(UserModel.email == email).first()
+        model = await self.db.scalar(BY_EMAIL, {"email": email})
         return self._to_entity(model) if model else None
     
     async def create(self, entity: User) -> User:
@@ -77,8 +93,8 @@ class UserRepository(IUserRepository):
         try:
             model = self._to_model(entity)
             self.db.add(model)
-            self.db.commit()
-            self.db.refresh(model)
+            await self.db.commit()
+            model = await self.db.scalar(RELOAD_BY_ID, {"id": model.id})
             return self._to_entity(model)
         except Exception as e:
             await self.db.rollback()
@@ -88,11 +104,11 @@ class UserRepository(IUserRepository):
         """Update an existing user."""
         try:
             model = self._to_model(entity)
-            self.db.merge(model)
-            self.db.commit()
-            
-            # Refresh and return updated entity
-            updated_model = self.db.query(UserModel).filter(UserModel.id == entity.id).first()
+            updated_model = await self.db.merge(model)
+            await self.db.commit()
+
+            # Reload with the role and its permissions, the same shape the lookups return
+            updated_model = await self.db.scalar(RELOAD_BY_ID, {"id": updated_model.id})
             return self._to_entity(updated_model)
         except Exception as e:
             await self.db.rollback()
@@ -101,10 +117,10 @@ class UserRepository(IUserRepository):
     async def delete(self, id: UUID) -> None:
         """Delete a user."""
         try:
-            model = self.db.query(UserModel).filter(UserModel.id == id).first()
+            model = await self.db.get(UserModel, id)
             if model:
-                self.db.delete(model)
-                self.db.commit()
+                await self.db.delete(model)
+                await self.db.commit()
         except Exception as e:
             await self.db.rollback()
             raise ValueError(f"Error deleting user: {str(e)}")
\ No newline at end of file
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
-from typing import Dict, Any
 from dependency_injector.wiring import inject, Provide
 
 from ..interfaces.controllers.auth_controller import IAuthController
 from ..schemas.request.signup import SignupRequest
 from ..schemas.response.login import LoginResponse
+from ..schemas.response.user_info import UserInfoResponse
 from ..dependencies.auth import get_current_user
 from ..container import Container
 
@@ -78,7 +78,7 @@ async def signup(
     return await auth_controller.signup(signup_data)
 
 @router.get("/me",
-            response_model=Dict[str, Any],
+            response_model=UserInfoResponse,
             status_code=status.HTTP_200_OK,
             responses={
                 401: {
@@ -100,7 +100,7 @@ async def signup(
 async def get_current_user(
     current_user: dict = Depends(get_current_user),
     auth_controller: IAuthController = Depends(Provide[Container.auth_controller])
-) -> Dict[str, Any]:
+) -> UserInfoResponse:
     """
     Endpoint to get current authenticated user information.
     
@@ -109,6 +109,6 @@ async def get_current_user(
         db: Database session
         
     Returns:
-        Dict[str, Any]: User information
+        UserInfoResponse: User information
     """
     return await auth_controller.get_current_user_info(current_user)
\ No newline at end of file
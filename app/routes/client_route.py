@@ -1,7 +1,6 @@
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query, status, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from dependency_injector.wiring import inject, Provide
 
 from ..interfaces.controllers.client_controller import IClientController
@@ -9,12 +8,25 @@ from ..interfaces.controllers.report_controller import IReportController
 from ..schemas.request.client import ClientCreate, ClientUpdate
 from ..schemas.response.client import ClientResponse
 from ..dependencies.auth import get_current_user, check_permissions
-from ..dependencies.rate_limit import check_user_pdf_rate_limit
 from ..entities.user import User
+from ..utils.etag import etag_matches
+from ..utils.json_body import json_response
+from ..utils.http_errors import problem_template, StaticHTTPException
 from ..container import Container
 
 router = APIRouter()
 
+# Repeat views within five minutes skip the server; after that the ETag makes revalidation cheap
+REPORT_CACHE_CONTROL = "private, max-age=300, stale-while-revalidate=300"
+
+# 400 body encoded once; a rejection only encodes its instance
+NO_REPORT_SECTIONS_BODY = problem_template({
+    "type": "about:blank",
+    "title": "Bad Request",
+    "status": 400,
+    "detail": "At least one section (transactions or invoices) must be included"
+})
+
 @router.post("",
             response_model=ClientResponse,
             status_code=status.HTTP_201_CREATED,
@@ -105,8 +117,8 @@ async def get_clients(
         List[ClientResponse]: List of clients matching criteria
     """
     if search:
-        return await client_controller.search_clients(search, current_user)
-    return await client_controller.get_all_clients(skip, limit, current_user)
+        return json_response(await client_controller.search_clients(search, current_user), List[ClientResponse])
+    return json_response(await client_controller.get_all_clients(skip, limit, current_user), List[ClientResponse])
 
 @router.put("/{client_id}",
            response_model=ClientResponse,
@@ -173,11 +185,9 @@ async def delete_client(
     return None
 
 @router.get("/{client_id}/report",
-           dependencies=[
-               Depends(check_permissions("clients", "read")),
-               Depends(check_user_pdf_rate_limit)
-            ],
+           dependencies=[Depends(check_permissions("clients", "read"))],
            responses={
+                304: {"description": "Report unchanged since the version in If-None-Match"},
                 401: {"description": "Not authenticated"},
                 403: {"description": "Not enough permissions"},
                 404: {"description": "Client not found"},
@@ -210,9 +220,10 @@ async def delete_client(
                    }
                }
            },
-           response_class=StreamingResponse)
+           response_class=Response)
 @inject
 async def get_client_report(
+    request: Request,
     client_id: UUID,
     include_transactions: bool = Query(True, description="Include transactions section in report"),
     include_invoices: bool = Query(True, description="Include invoices section in report"),
@@ -230,33 +241,47 @@ async def get_client_report(
         db: Database session
         
     Returns:
-        StreamingResponse: PDF report as streaming response
+        Response: PDF report
         
     Raises:
         HTTPException: If client not found or access denied
     """
     if not include_transactions and not include_invoices:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "type": "about:blank",
-                "title": "Bad Request",
-                "status": 400,
-                "detail": "At least one section (transactions or invoices) must be included",
-                "instance": f"/clients/{client_id}/report"
-            }
+        raise StaticHTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            NO_REPORT_SECTIONS_BODY(f"/clients/{client_id}/report")
         )
-    pdf_buffer = await report_controller.generate_client_financial_report(
+    version = await report_controller.get_report_version(
         client_id,
         current_user,
         include_transactions=include_transactions,
         include_invoices=include_invoices
     )
-    
-    return StreamingResponse(
-        pdf_buffer,
+    # Private: reports are per-user access controlled, so only the user's own browser may keep them
+    cache_headers = {
+        "ETag": f'"{version}"',
+        "Cache-Control": REPORT_CACHE_CONTROL,
+        "Vary": "Authorization"
+    }
+    if etag_matches(request, cache_headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    pdf_buffer = await report_controller.generate_client_financial_report(
+        client_id,
+        current_user,
+        include_transactions=include_transactions,
+        include_invoices=include_invoices,
+        version=version
+    )
+
+    # ReportLab only writes the document once it is fully laid out, so there is nothing to
+    # stream early; iterating the BytesIO would also split the binary PDF on every b"\n".
+    # Send the buffer as one body with a Content-Length instead, without copying it.
+    return Response(
+        content=pdf_buffer.getbuffer(),
         media_type="application/pdf",
         headers={
-            "Content-Disposition": f'attachment; filename="client_financial_report.pdf"'
+            "Content-Disposition": f'attachment; filename="client_financial_report.pdf"',
+            **cache_headers
         }
     )
\ No newline at end of file
@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import UUID
 from datetime import date
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 from dependency_injector.wiring import inject, Provide
 
 from ..interfaces.controllers.financial_transaction_controller import IFinancialTransactionController
@@ -10,6 +11,9 @@ from ..schemas.response.financial_transaction import FinancialTransactionRespons
 from ..entities.user import User
 from ..dependencies.auth import get_current_user, check_permissions
 from ..container import Container
+from ..utils.etag import etag_response
+from ..utils.json_body import json_response
+from ..utils.ndjson import NDJSON_MEDIA_TYPE, wants_ndjson
 
 router = APIRouter()
 
@@ -49,12 +53,14 @@ async def create_transaction(
            response_model=FinancialTransactionResponse,
            dependencies=[Depends(check_permissions("financial_transactions", "read"))],
            responses={
+               304: {"description": "Not modified"},
                401: {"description": "Not authenticated"},
                403: {"description": "Not enough permissions"},
                404: {"description": "Transaction not found"}
            })
 @inject
 async def get_transaction(
+    request: Request,
     transaction_id: UUID,
     current_user: User = Depends(get_current_user),
     transaction_controller: IFinancialTransactionController = Depends(Provide[Container.transaction_controller])
@@ -68,12 +74,12 @@ async def get_transaction(
         db: Database session
 
     Returns:
-        FinancialTransactionResponse: Retrieved transaction
+        FinancialTransactionResponse: Retrieved transaction, or 304 if If-None-Match matches its ETag
 
     Raises:
         HTTPException: If transaction not found or access denied
     """
-    return await transaction_controller.get_transaction(transaction_id, current_user)
+    return etag_response(request, await transaction_controller.get_transaction(transaction_id, current_user), FinancialTransactionResponse)
 
 @router.get("",
            response_model=List[FinancialTransactionResponse],
@@ -84,6 +90,7 @@ async def get_transaction(
            })
 @inject
 async def search_transactions(
+    request: Request,
     client_id: Optional[UUID] = Query(None, description="Filter by client ID"),
     category: Optional[str] = Query(None, description="Filter by category"),
     start_date: Optional[date] = Query(None, description="Filter from this date"),
@@ -92,10 +99,14 @@ async def search_transactions(
     max_amount: Optional[float] = Query(None, description="Maximum transaction amount"),
     current_user: User = Depends(get_current_user),
     transaction_controller: IFinancialTransactionController = Depends(Provide[Container.transaction_controller])
-) -> List[FinancialTransactionResponse]:
+) -> Union[List[FinancialTransactionResponse], StreamingResponse]:
     """
     Search and filter financial transactions.
 
+    Clients sending ``Accept: application/x-ndjson`` get the matches streamed as
+    newline-delimited JSON instead of a single list, so large result sets are never
+    held in memory at once.
+
     Args:
         client_id: Optional client ID filter
         category: Optional category filter
@@ -109,7 +120,21 @@ async def search_transactions(
     Returns:
         List[FinancialTransactionResponse]: List of matching transactions
     """
-    return await transaction_controller.search_transactions(
+    if wants_ndjson(request):
+        return StreamingResponse(
+            transaction_controller.stream_transactions(
+                client_id=client_id,
+                category=category,
+                start_date=start_date,
+                end_date=end_date,
+                min_amount=min_amount,
+                max_amount=max_amount,
+                current_user=current_user
+            ),
+            media_type=NDJSON_MEDIA_TYPE
+        )
+
+    return json_response(await transaction_controller.search_transactions(
         client_id=client_id,
         category=category,
         start_date=start_date,
@@ -117,7 +142,7 @@ async def search_transactions(
         min_amount=min_amount,
         max_amount=max_amount,
         current_user=current_user
-    )
+    ), List[FinancialTransactionResponse])
 
 @router.put("/{transaction_id}",
            response_model=FinancialTransactionResponse,
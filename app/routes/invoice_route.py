@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import UUID
 from datetime import date
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 from dependency_injector.wiring import inject, Provide
 
 from ..interfaces.controllers.invoice_controller import IInvoiceController
@@ -10,6 +11,9 @@ from ..schemas.response.invoice import InvoiceResponse
 from ..dependencies.auth import get_current_user, check_permissions
 from ..entities.user import User
 from ..container import Container
+from ..utils.etag import etag_response
+from ..utils.json_body import json_response
+from ..utils.ndjson import NDJSON_MEDIA_TYPE, wants_ndjson
 
 router = APIRouter()
 
@@ -68,18 +72,20 @@ async def get_overdue_invoices(
     Returns:
         List[Invoice]: List of overdue invoices
     """
-    return await invoice_controller.get_overdue_invoices(current_user)
+    return json_response(await invoice_controller.get_overdue_invoices(current_user), List[InvoiceResponse])
 
 @router.get("/{invoice_id}",
            response_model=InvoiceResponse,
            dependencies=[Depends(check_permissions("invoices", "read"))],
            responses={
+               304: {"description": "Not modified"},
                401: {"description": "Not authenticated"},
                403: {"description": "Not enough permissions"},
                404: {"description": "Invoice not found"}
            })
 @inject
 async def get_invoice(
+    request: Request,
     invoice_id: UUID,
     current_user: User = Depends(get_current_user),
     invoice_controller: IInvoiceController = Depends(Provide[Container.invoice_controller])
@@ -94,12 +100,12 @@ async def get_invoice(
         db: Database session
         
     Returns:
-        Invoice: Retrieved invoice
+        Invoice: Retrieved invoice, or 304 if If-None-Match matches its ETag
         
     Raises:
         HTTPException: If invoice not found or access denied
     """
-    return await invoice_controller.get_invoice(invoice_id, current_user)
+    return etag_response(request, await invoice_controller.get_invoice(invoice_id, current_user), InvoiceResponse)
 
 @router.get("",
            response_model=List[InvoiceResponse],
@@ -110,6 +116,7 @@ async def get_invoice(
            })
 @inject
 async def search_invoices(
+    request: Request,
     client_id: Optional[UUID] = Query(None, description="Filter by client ID"),
     status: Optional[str] = Query(None, description="Filter by status"),
     start_date: Optional[date] = Query(None, description="Filter from this date"),
@@ -119,10 +126,13 @@ async def search_invoices(
     is_overdue: Optional[bool] = Query(None, description="Filter overdue invoices"),
     current_user: User = Depends(get_current_user),
     invoice_controller: IInvoiceController = Depends(Provide[Container.invoice_controller])
-) -> List[InvoiceResponse]:
+) -> Union[List[InvoiceResponse], StreamingResponse]:
     """
     Search and filter invoices.
     Clients can only view their own invoices.
+
+    Clients sending ``Accept: application/x-ndjson`` get the matches streamed as
+    newline-delimited JSON instead of a single list.
     
     Args:
         client_id: Optional client filter
@@ -138,7 +148,22 @@ async def search_invoices(
     Returns:
         List[Invoice]: List of matching invoices
     """
-    return await invoice_controller.search_invoices(
+    if wants_ndjson(request):
+        return StreamingResponse(
+            invoice_controller.stream_invoices(
+                client_id=client_id,
+                status=status,
+                start_date=start_date,
+                end_date=end_date,
+                min_amount=min_amount,
+                max_amount=max_amount,
+                is_overdue=is_overdue,
+                current_user=current_user
+            ),
+            media_type=NDJSON_MEDIA_TYPE
+        )
+
+    return json_response(await invoice_controller.search_invoices(
         client_id=client_id,
         status=status,
         start_date=start_date,
@@ -147,7 +172,7 @@ async def search_invoices(
         max_amount=max_amount,
         is_overdue=is_overdue,
         current_user=current_user
-    )
+    ), List[InvoiceResponse])
 
 @router.put("/{invoice_id}",
            response_model=InvoiceResponse,
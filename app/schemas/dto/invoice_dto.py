@@ -27,4 +27,18 @@ class InvoiceDTO:
             invoice_date=entity.invoice_date,
             due_date=entity.due_date,
             created_by=entity.created_by
-        )
\ No newline at end of file
+        )
+    @classmethod
+    def from_create(cls, data, created_by: UUID):
+        """Build the DTO for a new invoice from an InvoiceCreate request."""
+        return cls(
+            id=None,
+            client_id=data.client_id,
+            amount_due=data.amount_due,
+            # InvoiceCreate defaults amount_paid to 0.00, so it is never None here
+            amount_paid=data.amount_paid,
+            status=None,
+            invoice_date=data.invoice_date,
+            due_date=data.due_date,
+            created_by=created_by
+        )
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class PermissionInfo(BaseModel):
+    """Schema for a permission granted through the user's role."""
+    resource: str
+    action: str
+
+class UserInfoResponse(BaseModel):
+    """Schema for the current user's profile and permissions."""
+    id: str
+    username: str
+    email: str
+    role: Optional[str] = None
+    permissions: List[PermissionInfo] = []
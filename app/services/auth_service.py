@@ -1,3 +1,6 @@
+import asyncio
+import time
+from collections import OrderedDict
 from typing import Optional
 from datetime import datetime, UTC
 from passlib.context import CryptContext
@@ -9,6 +12,7 @@ from ..interfaces.repositories.client_repository import IClientRepository
 from ..interfaces.services.audit_service import IAuditService
 from ..entities.user import User
 from ..entities.client import Client
+from ..entities.role import RoleName, CLIENT_ROLE_ID
 from ..schemas.response.login import LoginResponse
 from ..schemas.dto.client_dto import ClientDTO
 from ..schemas.dto.user_dto import UserDTO
@@ -16,7 +20,17 @@ from ..utils.jwt import create_access_token
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Hash checked against when the username doesn't exist, so misses cost the same as a wrong password.
+# Precomputed (same cost factor as pwd_context) rather than hashed at import time.
+_DUMMY_HASH = "$2b$12$antvpCprO23OXnA3PT1gdOM73nQTaf9/z5I13MSXft0i59gWP3whC"
+
+NEGATIVE_CACHE_TTL = 5.0
+NEGATIVE_CACHE_SIZE = 1024
+
 class AuthService(IAuthService):
+    # Usernames recently seen as unknown, shared across the per-request instances
+    _negative: "OrderedDict[str, float]" = OrderedDict()
+
     def __init__(self, user_repository: IUserRepository, client_repository: IClientRepository, audit_service: IAuditService):
         self.user_repository = user_repository
         self.client_repository = client_repository
@@ -25,15 +39,40 @@ class AuthService(IAuthService):
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return pwd_context.verify(plain_password, hashed_password)
 
+    def _is_known_missing(self, username: str) -> bool:
+        seen_at = self._negative.get(username)
+        if seen_at is None:
+            return False
+        if time.monotonic() - seen_at > NEGATIVE_CACHE_TTL:
+            del self._negative[username]
+            return False
+        self._negative.move_to_end(username)
+        return True
+
+    def _remember_missing(self, username: str) -> None:
+        self._negative[username] = time.monotonic()
+        self._negative.move_to_end(username)
+        if len(self._negative) > NEGATIVE_CACHE_SIZE:
+            self._negative.popitem(last=False)
+
     async def authenticate_user(self, username: str, password: str) -> Optional[LoginResponse]:
-        user = await self.user_repository.get_by_username(username)
-        if not user or not self.verify_password(password, user.password_hash):
+        user = None
+        if not self._is_known_missing(username):
+            user = await self.user_repository.get_by_username(username)
+            if not user:
+                self._remember_missing(username)
+        if not user:
+            await asyncio.to_thread(self.verify_password, password, _DUMMY_HASH)
+            return None
+
+        # bcrypt is deliberately slow, keep it off the event loop
+        if not await asyncio.to_thread(self.verify_password, password, user.password_hash):
             return None
             
         token_data = {
             "sub": str(user.id),
             "username": user.username,
-            "role": user.role.name if user.role else None
+            "role": user.role_name
         }
         
         access_token = create_access_token(token_data)
@@ -98,17 +137,15 @@ class AuthService(IAuthService):
             # Save through repository
             saved_client_entity = await self.client_repository.create(client_entity)
 
-            hashed_password = pwd_context.hash(user_dto.password_hash)
+            hashed_password = await asyncio.to_thread(pwd_context.hash, user_dto.password_hash)
             # Create user with client role
-            client_role_id = "094f40bd-14de-48b0-8979-c8a7da41cab2"  # Client role ID
-
             user_entity = User(
                 id=None,
                 username=user_dto.username,
                 email=user_dto.email,
                 password_hash=hashed_password,
-                role_id=client_role_id,
-                role="client",
+                role_id=CLIENT_ROLE_ID,
+                role=RoleName.CLIENT.value,
                 client_id=saved_client_entity.id,
                 created_at=datetime.now(UTC),
                 updated_at=datetime.now(UTC)
@@ -116,12 +153,13 @@ class AuthService(IAuthService):
 
             # Save through repository
             saved_user_entity = await self.user_repository.create(user_entity)
+            self._negative.pop(saved_user_entity.username, None)
             
             # Generate access token
             token_data = {
                 "sub": str(saved_user_entity.id),
                 "username": saved_user_entity.username,
-                "role": "client",
+                "role": RoleName.CLIENT.value,
                 "client_id": str(saved_user_entity.client_id)
             }
             
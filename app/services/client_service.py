@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime, UTC
 
@@ -98,18 +98,19 @@ class ClientService(IClientService):
             
         return ClientDTO.from_entity(client)
 
-    async def get_all_clients(self, skip: int = 0, limit: int = 100) -> List[ClientDTO]:
+    async def get_all_clients(self, skip: int = 0, limit: int = 100, client_id: Optional[UUID] = None) -> List[ClientDTO]:
         """
         Get all clients with pagination.
         
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            client_id: Optional client to restrict the results to
             
         Returns:
             List[Client]: List of clients
         """
-        clients = await self.client_repository.get_all(skip=skip, limit=limit)
+        clients = await self.client_repository.get_all(skip=skip, limit=limit, client_id=client_id)
         return [
             ClientDTO.from_entity(client)
             for client in clients
@@ -204,15 +205,16 @@ class ClientService(IClientService):
             details=f"Deleted client {client.name}"
         )
 
-    async def search_clients(self, search_term: str) -> List[ClientDTO]:
+    async def search_clients(self, search_term: str, client_id: Optional[UUID] = None) -> List[ClientDTO]:
         """
         Search clients by name or industry.
         
         Args:
             search_term: Term to search for
+            client_id: Optional client to restrict the search to
             
         Returns:
             List[ClientDTO]: List of matching clients
         """
-        clients = await self.client_repository.search_clients(search_term)
+        clients = await self.client_repository.search_clients(search_term, client_id=client_id)
         return [ClientDTO.from_entity(client) for client in clients]
\ No newline at end of file
@@ -0,0 +1,6 @@
+class NotFoundError(ValueError):
+    """Raised by services when the requested record does not exist.
+
+    Subclasses ValueError, so callers that only know about ValueError keep working.
+    """
+    pass
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from datetime import date, datetime, UTC
 
@@ -8,6 +8,7 @@ from ..interfaces.services.audit_service import IAuditService
 from ..entities.user import User
 from ..entities.financial_transaction import FinancialTransaction
 from ..schemas.dto.transaction_dto import TransactionDTO
+from .errors import NotFoundError
 from decimal import Decimal
 
 class FinancialTransactionService(IFinancialTransactionService):
@@ -80,11 +81,11 @@ class FinancialTransactionService(IFinancialTransactionService):
             TransactionDTO: Found transaction
             
         Raises:
-            ValueError: If transaction not found
+            NotFoundError: If transaction not found
         """
         transaction = await self.transaction_repository.get_by_id(transaction_id)
         if not transaction:
-            raise ValueError(f"Transaction with id '{transaction_id}' not found")
+            raise NotFoundError(f"Transaction with id '{transaction_id}' not found")
             
         return TransactionDTO.from_entity(transaction)
 
@@ -112,10 +113,11 @@ class FinancialTransactionService(IFinancialTransactionService):
         Raises:
             ValueError: If date range is invalid
         """
+        # Outside the try so it is not reported as a failed search, matching the streamed search
+        if start_date and end_date and end_date < start_date:
+            raise ValueError("End date cannot be before start date")
+
         try:
-            if start_date and end_date and end_date < start_date:
-                raise ValueError("End date cannot be before start date")
-            
             # Convert amounts to Decimal if provided
             min_amount_decimal = Decimal(str(min_amount)) if min_amount is not None else None
             max_amount_decimal = Decimal(str(max_amount)) if max_amount is not None else None
@@ -139,6 +141,43 @@ class FinancialTransactionService(IFinancialTransactionService):
         except Exception as e:
             raise ValueError(f"Error searching transactions: {str(e)}")
 
+    def stream_transactions(self,
+                        client_id: Optional[UUID] = None,
+                        category: Optional[str] = None,
+                        start_date: Optional[date] = None,
+                        end_date: Optional[date] = None,
+                        min_amount: Optional[float] = None,
+                        max_amount: Optional[float] = None) -> AsyncIterator[TransactionDTO]:
+        """
+        Stream transactions matching the same filters as search_transactions.
+
+        Filters are validated up front, so a bad date range raises here rather than
+        once the caller has started consuming the stream.
+
+        Returns:
+            AsyncIterator[TransactionDTO]: Matching transactions, one at a time
+
+        Raises:
+            ValueError: If date range is invalid
+        """
+        if start_date and end_date and end_date < start_date:
+            raise ValueError("End date cannot be before start date")
+
+        transactions = self.transaction_repository.stream_transactions(
+            client_id=client_id,
+            category=category,
+            start_date=start_date,
+            end_date=end_date,
+            min_amount=Decimal(str(min_amount)) if min_amount is not None else None,
+            max_amount=Decimal(str(max_amount)) if max_amount is not None else None
+        )
+
+        async def to_dtos() -> AsyncIterator[TransactionDTO]:
+            async for transaction in transactions:
+                yield TransactionDTO.from_entity(transaction)
+
+        return to_dtos()
+
     async def update_transaction(self, 
                        transaction_dto: TransactionDTO,
                        current_user: User) -> TransactionDTO:
@@ -153,13 +192,14 @@ class FinancialTransactionService(IFinancialTransactionService):
             TransactionDTO: Updated transaction
             
         Raises:
-            ValueError: If transaction not found or validation fails
+            NotFoundError: If transaction not found
+            ValueError: If validation fails
         """
         try:
             # Get existing transaction
             existing_transaction = await self.transaction_repository.get_by_id(transaction_dto.id)
             if not existing_transaction:
-                raise ValueError(f"Transaction with id {transaction_dto.id} not found")
+                raise NotFoundError(f"Transaction with id {transaction_dto.id} not found")
             
             # Update fields while preserving others
             if transaction_dto.amount:
@@ -191,6 +231,8 @@ class FinancialTransactionService(IFinancialTransactionService):
             # Convert entity to DTO and return
             return TransactionDTO.from_entity(updated_transaction)
 
+        except NotFoundError:
+            raise
         except Exception as e:
             raise ValueError(f"Error updating transaction: {str(e)}")
 
@@ -205,7 +247,7 @@ class FinancialTransactionService(IFinancialTransactionService):
         # Verify transaction exists
         transaction = await self.transaction_repository.get_by_id(transaction_id)
         if not transaction:
-            raise ValueError(f"Transaction with id {transaction_id} not found")
+            raise NotFoundError(f"Transaction with id {transaction_id} not found")
         
         await self.transaction_repository.delete(transaction_id)
 
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from datetime import date, datetime, UTC
 from decimal import Decimal
@@ -9,6 +9,7 @@ from ..interfaces.services.audit_service import IAuditService
 from ..entities.user import User
 from ..entities.invoice import Invoice, InvoiceStatus
 from ..schemas.dto.invoice_dto import InvoiceDTO
+from .errors import NotFoundError
 
 class InvoiceService(IInvoiceService):
     """
@@ -83,11 +84,11 @@ class InvoiceService(IInvoiceService):
             InvoiceDetailDTO: Found invoice
             
         Raises:
-            ValueError: If invoice not found
+            NotFoundError: If invoice not found
         """
         invoice = await self.invoice_repository.get_by_id(invoice_id)
         if not invoice:
-            raise ValueError(f"Invoice with id {invoice_id} not found")
+            raise NotFoundError(f"Invoice with id {invoice_id} not found")
 
         return InvoiceDTO.from_entity(invoice)
 
@@ -117,11 +118,11 @@ class InvoiceService(IInvoiceService):
         Raises:
             ValueError: If search parameters are invalid
         """
-        try:
-            # Validate date range if provided
-            if start_date and end_date and end_date < start_date:
-                raise ValueError("End date cannot be before start date")
+        # Outside the try so it is not reported as a failed search, matching the streamed search
+        if start_date and end_date and end_date < start_date:
+            raise ValueError("End date cannot be before start date")
 
+        try:
             # Convert amounts to Decimal if provided
             min_amount_decimal = Decimal(str(min_amount)) if min_amount is not None else None
             max_amount_decimal = Decimal(str(max_amount)) if max_amount is not None else None
@@ -146,6 +147,42 @@ class InvoiceService(IInvoiceService):
         except Exception as e:
             raise ValueError(f"Error searching invoices: {str(e)}")
 
+    def stream_invoices(self,
+                        client_id: Optional[UUID] = None,
+                        status: Optional[str] = None,
+                        start_date: Optional[date] = None,
+                        end_date: Optional[date] = None,
+                        min_amount: Optional[float] = None,
+                        max_amount: Optional[float] = None,
+                        is_overdue: Optional[bool] = None) -> AsyncIterator[InvoiceDTO]:
+        """
+        Stream invoices matching the same filters as search_invoices.
+
+        Returns:
+            AsyncIterator[InvoiceDTO]: Matching invoices, one at a time
+
+        Raises:
+            ValueError: If search parameters are invalid, before anything is streamed
+        """
+        if start_date and end_date and end_date < start_date:
+            raise ValueError("End date cannot be before start date")
+
+        invoices = self.invoice_repository.stream(
+            client_id=client_id,
+            status=status,
+            start_date=start_date,
+            end_date=end_date,
+            min_amount=Decimal(str(min_amount)) if min_amount is not None else None,
+            max_amount=Decimal(str(max_amount)) if max_amount is not None else None,
+            is_overdue=is_overdue
+        )
+
+        async def to_dtos() -> AsyncIterator[InvoiceDTO]:
+            async for invoice in invoices:
+                yield InvoiceDTO.from_entity(invoice)
+
+        return to_dtos()
+
     async def update_invoice(self, invoice_dto: InvoiceDTO, current_user: User) -> InvoiceDTO:
         """
         Update an existing invoice.
@@ -159,13 +196,14 @@ class InvoiceService(IInvoiceService):
             InvoiceDetailDTO: Updated invoice
             
         Raises:
-            ValueError: If invoice not found or validation fails
+            NotFoundError: If invoice not found
+            ValueError: If validation fails
         """
         try:
             # Get existing invoice
             existing_invoice = await self.invoice_repository.get_by_id(invoice_dto.id)
             if not existing_invoice:
-                raise ValueError(f"Invoice with id {invoice_dto.id} not found")
+                raise NotFoundError(f"Invoice with id {invoice_dto.id} not found")
 
             # Update fields while preserving others
             if invoice_dto.invoice_date:
@@ -198,6 +236,8 @@ class InvoiceService(IInvoiceService):
             # Convert entity to DTO and return
             return InvoiceDTO.from_entity(updated_invoice)
 
+        except NotFoundError:
+            raise
         except Exception as e:
             raise ValueError(f"Error updating invoice: {str(e)}")
 
@@ -213,11 +253,12 @@ class InvoiceService(IInvoiceService):
             None
             
         Raises:
-            ValueError: If invoice not found or cannot be deleted
+            NotFoundError: If invoice not found
+            ValueError: If invoice cannot be deleted
         """
         invoice = await self.invoice_repository.get_by_id(invoice_id)
         if not invoice:
-            raise ValueError(f"Invoice with id {invoice_id} not found")
+            raise NotFoundError(f"Invoice with id {invoice_id} not found")
 
         if invoice.status == InvoiceStatus.PAID:
             raise ValueError("Cannot delete a paid invoice")
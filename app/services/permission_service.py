@@ -1,4 +1,5 @@
 from typing import Optional
+from uuid import UUID
 
 from ..interfaces.services.permission_service import IPermissionService
 from ..interfaces.repositories.permission_repository import IPermissionRepository
@@ -12,7 +13,7 @@ class PermissionService(IPermissionService):
     def __init__(self, permission_repository: IPermissionRepository):
         self.permission_repository = permission_repository
 
-    async def check_permission(self, role_id: str, resource: str, action: str) -> Optional[Permission]:
+    async def check_permission(self, role_id: UUID, resource: str, action: str) -> Optional[Permission]:
         """
         Check if the given role_id has the required resource and action permission.
         """
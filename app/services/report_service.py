@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 from uuid import UUID
 from io import BytesIO
 
@@ -73,6 +75,37 @@ class ReportService(IReportService):
             client_id=client_id
         )
 
+    async def get_report_version(
+            self,
+            client_id: UUID,
+            include_transactions: bool = True,
+            include_invoices: bool = True
+        ) -> str:
+        """
+        Get a tag that changes whenever the data behind a client's report does.
+
+        Built from the client's last update and the count and latest update of each included
+        section, so added, edited and deleted rows all yield a new tag.
+
+        Args:
+            client_id: UUID of client
+            include_transactions: Whether the report includes transactions
+            include_invoices: Whether the report includes invoices
+
+        Returns:
+            str: Hex digest identifying this version of the report
+
+        Raises:
+            ValueError: If client not found
+        """
+        client = await self._get_client_data(client_id)
+        parts = [str(client_id), str(client.updated_at)]
+        if include_transactions:
+            parts.append("t:%s:%s" % await self.transaction_repository.get_change_marker(client_id))
+        if include_invoices:
+            parts.append("i:%s:%s" % await self.invoice_repository.get_change_marker(client_id))
+        return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
     async def generate_client_financial_report(
             self,
             client_id: UUID,
@@ -103,8 +136,9 @@ class ReportService(IReportService):
             invoices = await self._get_client_invoices(client_id)
         
         try:
-            # Generate PDF using utility function
-            return generate_financial_report(
+            # Generate PDF using utility function; rendering is CPU-bound, keep it off the event loop
+            return await asyncio.to_thread(
+                generate_financial_report,
                 client_name=client.name,
                 transactions=transactions if include_transactions else None,
                 invoices=invoices if include_invoices else None
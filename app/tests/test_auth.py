@@ -0,0 +1,137 @@
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+import pytest
+
+from app.dependencies import auth
+from app.entities.user import User
+from app.services import auth_service
+from app.services.auth_service import AuthService
+
+class StubUserRepository:
+    """User repository that knows no users and counts the lookups made"""
+    def __init__(self):
+        self.lookups = 0
+
+    async def get_by_username(self, username):
+        self.lookups += 1
+        return None
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(AuthService, "_negative", OrderedDict())
+    # bcrypt is deliberately slow and irrelevant to what is counted here
+    monkeypatch.setattr(AuthService, "verify_password", lambda self, plain, hashed: False)
+    return AuthService(StubUserRepository(), client_repository=None, audit_service=None)
+
+class TestNegativeUsernameCache:
+    def test_unknown_username_is_looked_up_once(self, service):
+        """Test that a repeated unknown username skips the database within the TTL"""
+        assert asyncio.run(service.authenticate_user("ghost", "secret")) is None
+        assert asyncio.run(service.authenticate_user("ghost", "secret")) is None
+        assert service.user_repository.lookups == 1
+
+    def test_unknown_username_expires(self, service, monkeypatch):
+        """Test that an unknown username is looked up again once the TTL has passed"""
+        now = [1000.0]
+        monkeypatch.setattr(auth_service.time, "monotonic", lambda: now[0])
+
+        asyncio.run(service.authenticate_user("ghost", "secret"))
+        now[0] += auth_service.NEGATIVE_CACHE_TTL + 1
+        asyncio.run(service.authenticate_user("ghost", "secret"))
+        assert service.user_repository.lookups == 2
+
+    def test_cache_is_bounded(self, service):
+        """Test that the oldest unknown usernames are evicted past the size limit"""
+        for i in range(auth_service.NEGATIVE_CACHE_SIZE + 1):
+            asyncio.run(service.authenticate_user(f"ghost{i}", "secret"))
+        assert len(AuthService._negative) == auth_service.NEGATIVE_CACHE_SIZE
+        assert "ghost0" not in AuthService._negative
+
+class TestDummyHash:
+    def test_dummy_hash_costs_the_same_as_real_hashes(self):
+        """Test that the precomputed dummy hash uses pwd_context's scheme and cost factor"""
+        handler = auth_service.pwd_context.handler()
+        assert auth_service.pwd_context.identify(auth_service._DUMMY_HASH) == handler.name
+        assert handler.from_string(auth_service._DUMMY_HASH).rounds == handler.default_rounds
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(auth, "_user_cache", OrderedDict())
+    monkeypatch.setattr(auth.time, "time", lambda: now[0])
+    return now
+
+def make_user():
+    role = SimpleNamespace(
+        name="finance",
+        updated_at=datetime(2025, 1, 1),
+        permissions=[SimpleNamespace(resource="invoices", action="read")]
+    )
+    return User(
+        id=uuid4(),
+        username="testuser",
+        email="test@example.com",
+        password_hash="hash",
+        role_id=uuid4(),
+        role=role,
+        client_id=None,
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 1)
+    )
+
+class TestUserCache:
+    def test_hit_returns_a_fresh_user(self, clock):
+        """Test that each hit gets its own User with a read-only copy of the role"""
+        user = make_user()
+        auth._remember_user(b"key", user, token_exp=None)
+        user.role.permissions.append(SimpleNamespace(resource="invoices", action="delete"))
+
+        first = auth._cached_user(b"key")
+        assert first is not user
+        assert first.id == user.id
+        assert first.is_admin is False and first.role_name == "finance"
+        assert first.has_permission("invoices", "read")
+        assert not first.has_permission("invoices", "delete")
+        assert first.password_hash == ""
+
+        first.role = "admin"
+        second = auth._cached_user(b"key")
+        assert second.role_name == "finance"
+        with pytest.raises(AttributeError):
+            second.role.name = "admin"
+
+    def test_entry_expires_after_ttl(self, clock):
+        """Test that an entry is dropped once USER_CACHE_TTL has passed"""
+        auth._remember_user(b"key", make_user(), token_exp=None)
+        clock[0] += auth.USER_CACHE_TTL - 1
+        assert auth._cached_user(b"key") is not None
+        clock[0] += 1
+        assert auth._cached_user(b"key") is None
+        assert b"key" not in auth._user_cache
+
+    def test_password_hash_is_not_cached(self, clock):
+        """Test that the cached snapshot keeps no copy of the password hash"""
+        auth._remember_user(b"key", make_user(), token_exp=None)
+        _, snapshot = auth._user_cache[b"key"]
+        assert "hash" not in snapshot
+        assert not hasattr(snapshot, "password_hash")
+
+    def test_entry_never_outlives_token(self, clock):
+        """Test that an entry expires at the token's exp when that comes before the TTL"""
+        auth._remember_user(b"key", make_user(), token_exp=clock[0] + 5)
+        clock[0] += 4
+        assert auth._cached_user(b"key") is not None
+        clock[0] += 1
+        assert auth._cached_user(b"key") is None
+
+    def test_cache_is_bounded(self, clock, monkeypatch):
+        """Test that the least recently used token is evicted past the size limit"""
+        monkeypatch.setattr(auth, "USER_CACHE_SIZE", 2)
+        auth._remember_user(b"a", make_user(), token_exp=None)
+        auth._remember_user(b"b", make_user(), token_exp=None)
+        auth._cached_user(b"a")
+        auth._remember_user(b"c", make_user(), token_exp=None)
+        assert list(auth._user_cache) == [b"a", b"c"]
@@ -0,0 +1,134 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+import orjson
+import pytest
+
+from app.entities.user import User
+from app.entities.role import RoleName
+from app.entities.invoice import Invoice, InvoiceStatus
+from app.entities.audit_log import AuditLog, ChangeType, Resource
+
+def make_user(role):
+    return User(
+        id=uuid4(),
+        username="testuser",
+        email="test@example.com",
+        password_hash="hash",
+        role_id=uuid4(),
+        role=role,
+        client_id=None,
+        created_at=datetime.now(),
+        updated_at=datetime.now()
+    )
+
+class TestUserEntity:
+    def test_role_predicates(self):
+        """Test role predicates for a role given by name"""
+        user = make_user(RoleName.ADMIN.value)
+        assert user.role_name == "admin"
+        assert user.is_admin
+        assert not user.is_client
+
+    def test_role_predicates_follow_role_changes(self):
+        """Test that role predicates reflect the role currently set on the user"""
+        user = make_user(RoleName.ADMIN.value)
+        assert user.is_admin
+        user.role = RoleName.CLIENT.value
+        assert not user.is_admin
+        assert user.is_client
+
+    def test_permissions_follow_role_changes(self):
+        """Test that permission checks use the role currently set on the user"""
+        reader = SimpleNamespace(name="auditor", permissions=[SimpleNamespace(resource="invoices", action="read")])
+        user = make_user(reader)
+        assert user.has_permission("invoices", "read")
+        user.role = SimpleNamespace(name="client", permissions=[])
+        assert not user.has_permission("invoices", "read")
+
+    def test_slotted_and_keyword_only(self):
+        """Test that User, like the other entities, takes keywords only and has no instance __dict__"""
+        user = make_user(RoleName.ADMIN.value)
+        assert not hasattr(user, "__dict__")
+        with pytest.raises(AttributeError):
+            user.is_superuser = True
+        with pytest.raises(TypeError):
+            User(uuid4(), "testuser", "test@example.com", "hash", uuid4(), "admin", None, datetime.now(), datetime.now())
+
+def make_audit_log(timestamp):
+    return AuditLog(
+        id=uuid4(),
+        changed_by=None,
+        table_name="invoices",
+        record_id=uuid4(),
+        change_type=ChangeType.UPDATE,
+        change_details={"status": "paid"},
+        timestamp=timestamp
+    )
+
+class TestAuditLogEntity:
+    def test_to_dict(self):
+        """Test that to_dict gives plain values and a naive ISO timestamp"""
+        log = make_audit_log(datetime(2025, 1, 2, 3, 4, 5, 678))
+        data = log.to_dict()
+        assert data["id"] == str(log.id)
+        assert data["changed_by"] is None
+        assert data["table_name"] == "invoices"
+        assert data["change_type"] == "UPDATE"
+        assert data["change_details"] == {"status": "paid"}
+        assert data["timestamp"] == "2025-01-02T03:04:05.000678"
+
+    def test_enum_values_for_members_and_strings(self):
+        """Test that table_name and change_type give the same value whether set as a member or a string"""
+        log = make_audit_log(datetime(2025, 1, 1))
+        log.table_name = Resource.INVOICE
+        log.change_type = "UPDATE"
+        data = log.to_dict()
+        assert data["table_name"] == "invoices"
+        assert data["change_type"] == "UPDATE"
+        assert type(data["table_name"]) is str and type(data["change_type"]) is str
+
+    def test_to_json_matches_to_dict(self):
+        """Test that to_json encodes the same document as to_dict, timestamp format included"""
+        for timestamp in (datetime(2025, 1, 2, 3, 4, 5), datetime(2025, 1, 2, 3, 4, 5, 678),
+                          datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)):
+            log = make_audit_log(timestamp)
+            assert orjson.loads(log.to_json()) == log.to_dict()
+
+def load_invoice(amount_due, amount_paid):
+    return Invoice.from_trusted(
+        id=uuid4(),
+        client_id=uuid4(),
+        created_by=uuid4(),
+        invoice_date=date(2025, 1, 1),
+        due_date=date(2025, 2, 1),
+        amount_due=Decimal(amount_due),
+        amount_paid=Decimal(amount_paid),
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 1)
+    )
+
+class TestInvoiceEntity:
+    def test_from_trusted_derives_status(self):
+        """Test that a loaded invoice's status follows its amounts"""
+        assert load_invoice("100.00", "0.00").status is InvoiceStatus.PENDING
+        assert load_invoice("100.00", "40.00").status is InvoiceStatus.PARTIALLY_PAID
+        assert load_invoice("100.00", "100.00").status is InvoiceStatus.PAID
+
+    def test_from_trusted_matches_constructor(self):
+        """Test that from_trusted builds the same invoice as the validating constructor"""
+        loaded = load_invoice("100.00", "40.00")
+        built = Invoice(
+            id=loaded.id,
+            client_id=loaded.client_id,
+            created_by=loaded.created_by,
+            invoice_date=loaded.invoice_date,
+            due_date=loaded.due_date,
+            amount_due=loaded.amount_due,
+            amount_paid=loaded.amount_paid,
+            status="PAID",
+            created_at=loaded.created_at,
+            updated_at=loaded.updated_at
+        )
+        assert built == loaded
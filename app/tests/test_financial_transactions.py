@@ -2,7 +2,8 @@ import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 from app.main import app
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+import json
 import uuid
 
 @pytest.fixture
@@ -219,4 +220,37 @@ def test_search_with_date_range(client, test_tokens):
     
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
-    assert isinstance(data, list)
\ No newline at end of file
+    assert isinstance(data, list)
+
+def test_search_transactions_as_ndjson(client, test_tokens):
+    """Test that NDJSON search streams the same transactions as the JSON list"""
+    headers = {"Authorization": f"Bearer {test_tokens['admin']}"}
+    json_response = client.get("/finance/transactions?category=License", headers=headers)
+    ndjson_response = client.get(
+        "/finance/transactions?category=License",
+        headers={**headers, "Accept": "application/x-ndjson"}
+    )
+
+    assert ndjson_response.status_code == status.HTTP_200_OK
+    assert ndjson_response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in ndjson_response.text.splitlines()]
+    assert sorted(t["id"] for t in lines) == sorted(t["id"] for t in json_response.json())
+    assert all(t["category"] == "License" for t in lines)
+
+def test_search_with_invalid_date_range(client, test_tokens):
+    """Test that an inverted date range is a 400 with the same problem body in JSON and NDJSON"""
+    url = f"/finance/transactions?start_date={date.today()}&end_date={date.today() - timedelta(days=1)}"
+    headers = {"Authorization": f"Bearer {test_tokens['finance']}"}
+    json_response = client.get(url, headers=headers)
+    ndjson_response = client.get(url, headers={**headers, "Accept": "application/x-ndjson"})
+
+    assert json_response.status_code == status.HTTP_400_BAD_REQUEST
+    assert ndjson_response.status_code == status.HTTP_400_BAD_REQUEST
+    assert json_response.json() == ndjson_response.json()
+    assert json_response.json()["detail"] == {
+        "type": "about:blank",
+        "title": "Invalid search parameters",
+        "status": 400,
+        "detail": "End date cannot be before start date",
+        "instance": "/finance/transactions"
+    }
@@ -4,6 +4,7 @@ from fastapi.testclient import TestClient
 from app.main import app
 from datetime import date, timedelta
 from decimal import Decimal
+import json
 import uuid
 
 @pytest.fixture
@@ -283,4 +284,110 @@ def test_get_invoices_as_auditor(client, test_tokens):
     
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
-    assert isinstance(data, list)
\ No newline at end of file
+    assert isinstance(data, list)
+
+def test_search_invoices_by_overdue(client, test_tokens, sample_client_ids):
+    """Test that is_overdue=false is the exact complement of is_overdue=true, paid past-due invoices included"""
+    headers = {"Authorization": f"Bearer {test_tokens['admin']}"}
+    paid_response = client.post(
+        "/invoices",
+        headers=headers,
+        json={
+            "client_id": sample_client_ids["eco"],
+            "invoice_date": (date.today() - timedelta(days=60)).isoformat(),
+            "due_date": (date.today() - timedelta(days=30)).isoformat(),
+            "amount_due": str(Decimal('200.00')),
+            "amount_paid": str(Decimal('200.00')),
+            "status": "PAID"
+        }
+    )
+    assert paid_response.status_code == status.HTTP_201_CREATED
+    paid_id = paid_response.json()["id"]
+
+    query = f"/invoices?client_id={sample_client_ids['eco']}"
+    all_ids = {inv["id"] for inv in client.get(query, headers=headers).json()}
+    overdue = client.get(f"{query}&is_overdue=true", headers=headers).json()
+    not_overdue = client.get(f"{query}&is_overdue=false", headers=headers).json()
+
+    overdue_ids = {inv["id"] for inv in overdue}
+    not_overdue_ids = {inv["id"] for inv in not_overdue}
+    assert overdue_ids.isdisjoint(not_overdue_ids)
+    assert overdue_ids | not_overdue_ids == all_ids
+    assert paid_id in not_overdue_ids
+    assert all(inv["status"] != "PAID" and date.fromisoformat(inv["due_date"]) < date.today() for inv in overdue)
+
+INVALID_DATE_RANGE_PROBLEM = {
+    "type": "about:blank",
+    "title": "Invalid search parameters",
+    "status": 400,
+    "detail": "End date cannot be before start date",
+    "instance": "/invoices"
+}
+
+def test_search_invoices_with_invalid_date_range(client, test_tokens):
+    """Test that invalid search filters are a 400 problem, also when filtering by status"""
+    response = client.get(
+        f"/invoices?status=PENDING&start_date={date.today()}&end_date={date.today() - timedelta(days=1)}",
+        headers={"Authorization": f"Bearer {test_tokens['admin']}"}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == INVALID_DATE_RANGE_PROBLEM
+
+def test_get_invoice_etag(client, test_tokens, sample_client_ids):
+    """Test that a current ETag gets a 304 and an update changes the ETag"""
+    headers = {"Authorization": f"Bearer {test_tokens['admin']}"}
+    create_response = client.post(
+        "/invoices",
+        headers=headers,
+        json={
+            "client_id": sample_client_ids["tech"],
+            "invoice_date": date.today().isoformat(),
+            "due_date": (date.today() + timedelta(days=30)).isoformat(),
+            "amount_due": str(Decimal('800.00')),
+            "amount_paid": str(Decimal('0.00')),
+            "status": "PENDING"
+        }
+    )
+    invoice_id = create_response.json()["id"]
+
+    response = client.get(f"/invoices/{invoice_id}", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+    assert response.headers["Vary"] == "Authorization"
+
+    not_modified = client.get(f"/invoices/{invoice_id}", headers={**headers, "If-None-Match": etag})
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+
+    client.put(f"/invoices/{invoice_id}", headers=headers, json={"amount_paid": str(Decimal('100.00'))})
+    modified = client.get(f"/invoices/{invoice_id}", headers={**headers, "If-None-Match": etag})
+    assert modified.status_code == status.HTTP_200_OK
+    assert modified.headers["ETag"] != etag
+    assert modified.json()["status"] == "PARTIALLY_PAID"
+
+def test_search_invoices_as_ndjson(client, test_tokens):
+    """Test that NDJSON search streams the same invoices as the JSON list"""
+    headers = {"Authorization": f"Bearer {test_tokens['admin']}"}
+    json_response = client.get("/invoices?status=PENDING", headers=headers)
+    ndjson_response = client.get(
+        "/invoices?status=PENDING",
+        headers={**headers, "Accept": "application/x-ndjson"}
+    )
+
+    assert ndjson_response.status_code == status.HTTP_200_OK
+    assert ndjson_response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in ndjson_response.text.splitlines()]
+    assert sorted(inv["id"] for inv in lines) == sorted(inv["id"] for inv in json_response.json())
+    assert all(inv["status"] == "PENDING" for inv in lines)
+
+def test_search_invoices_as_ndjson_with_invalid_date_range(client, test_tokens):
+    """Test that NDJSON search answers an inverted date range with the JSON search's 400"""
+    response = client.get(
+        f"/invoices?status=PENDING&start_date={date.today()}&end_date={date.today() - timedelta(days=1)}",
+        headers={"Authorization": f"Bearer {test_tokens['admin']}", "Accept": "application/x-ndjson"}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == INVALID_DATE_RANGE_PROBLEM
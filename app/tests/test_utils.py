@@ -0,0 +1,87 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List
+from uuid import uuid4
+import json
+from fastapi import Request
+
+from app.utils import clock
+from app.utils.etag import etag_matches
+from app.utils.json_body import encode_json
+from app.entities.invoice import InvoiceStatus
+from app.schemas.response.invoice import InvoiceResponse
+
+def make_request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+class TestEtagMatches:
+    def test_no_header(self):
+        """Test that a request without If-None-Match never matches"""
+        assert not etag_matches(make_request(), '"abc"')
+
+    def test_exact_and_listed_tags(self):
+        """Test matching one tag or any tag of a list"""
+        assert etag_matches(make_request('"abc"'), '"abc"')
+        assert etag_matches(make_request('"xyz", "abc"'), '"abc"')
+        assert not etag_matches(make_request('"xyz"'), '"abc"')
+
+    def test_weak_tag_and_wildcard(self):
+        """Test that weak comparison and * both match"""
+        assert etag_matches(make_request('W/"abc"'), '"abc"')
+        assert etag_matches(make_request("*"), '"abc"')
+
+class TestClockToday:
+    def test_rolls_over_at_midnight(self, monkeypatch):
+        """Test that today() is cached during the day and moves to the next date at local midnight"""
+        calls = []
+        current = [date(2025, 1, 1)]
+
+        class FakeDate(date):
+            @classmethod
+            def today(cls):
+                calls.append(current[0])
+                return current[0]
+
+        midnight = datetime(2025, 1, 2).timestamp()
+        now = [midnight - 60]
+        monkeypatch.setattr(clock, "date", FakeDate)
+        monkeypatch.setattr(clock.time, "time", lambda: now[0])
+        monkeypatch.setattr(clock, "_today", date.min)
+        monkeypatch.setattr(clock, "_tomorrow_at", 0.0)
+
+        assert clock.today() == date(2025, 1, 1)
+        now[0] = midnight - 1
+        assert clock.today() == date(2025, 1, 1)
+        assert len(calls) == 1
+
+        current[0] = date(2025, 1, 2)
+        now[0] = midnight
+        assert clock.today() == date(2025, 1, 2)
+        assert len(calls) == 2
+
+class TestEncodeJson:
+    def test_encodes_through_response_model(self):
+        """Test that only the response model's fields are sent, with Decimals as strings"""
+        invoice = InvoiceResponse.model_construct(
+            id=uuid4(),
+            client_id=uuid4(),
+            created_by=uuid4(),
+            invoice_date=date(2025, 1, 1),
+            due_date=date(2025, 2, 1),
+            amount_due=Decimal("10.50"),
+            amount_paid=Decimal("0.00"),
+            status=InvoiceStatus.PENDING,
+            password_hash="not part of the schema"
+        )
+        data = json.loads(encode_json([invoice], List[InvoiceResponse]))
+        assert data == [{
+            "client_id": str(invoice.client_id),
+            "invoice_date": "2025-01-01",
+            "due_date": "2025-02-01",
+            "amount_due": "10.50",
+            "amount_paid": "0.00",
+            "id": str(invoice.id),
+            "created_by": str(invoice.created_by),
+            "status": "PENDING"
+        }]
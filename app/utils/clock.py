@@ -0,0 +1,18 @@
+import time
+from datetime import date, datetime, timedelta
+
+_today = date.min
+_tomorrow_at = 0.0
+
+def today() -> date:
+    """
+    Same result as date.today(), computed once per day.
+
+    Entity validation calls this for every row loaded, so the local date is cached until
+    the next local midnight; in between each call is a single time.time() comparison.
+    """
+    global _today, _tomorrow_at
+    if time.time() >= _tomorrow_at:
+        _today = date.today()
+        _tomorrow_at = datetime.combine(_today + timedelta(days=1), datetime.min.time()).timestamp()
+    return _today
@@ -0,0 +1,35 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+from .json_body import encode_json
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match covers the given (quoted) entity tag."""
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and any(
+        tag.strip().removeprefix("W/") in (etag, "*") for tag in if_none_match.split(",")
+    )
+
+def etag_response(request: Request, payload: Any, response_model: Any) -> Response:
+    """
+    Encode a single resource once, tag it with a hash of the body and honour If-None-Match.
+
+    Args:
+        request: Incoming request, read for its If-None-Match header
+        payload: Response model to send
+        response_model: The route's response model, used to encode the payload
+
+    Returns:
+        Response: 304 without a body when the client's copy is current, otherwise the JSON body
+    """
+    body = encode_json(payload, response_model)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    # Bodies differ per user (access rules), so shared caches must key on the token too
+    headers = {"ETag": etag, "Vary": "Authorization"}
+
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,86 @@
+import inspect
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+import orjson
+from fastapi import HTTPException
+
+T = TypeVar("T")
+
+def problem_body(detail: Dict[str, Any]) -> bytes:
+    """Encode a problem detail exactly as FastAPI's HTTPException handler would ({"detail": ...})."""
+    return orjson.dumps({"detail": detail})
+
+def problem_template(detail: Dict[str, Any]) -> Callable[[str], bytes]:
+    """
+    Pre-encode a problem detail whose only per-request member is its instance.
+
+    Returns a function that appends the encoded instance to the bytes built here,
+    giving the same body as problem_body({**detail, "instance": instance}).
+    """
+    # "instance" is the last key, so the encoded body ends with its placeholder
+    prefix = problem_body({**detail, "instance": None})[:-len(b"null}}")]
+
+    def render(instance: str) -> bytes:
+        return prefix + orjson.dumps(instance) + b"}}"
+    return render
+
+class StaticHTTPException(HTTPException):
+    """
+    HTTPException for fully static errors, carrying a body encoded once at import time.
+
+    Raise a fresh instance each time (not a shared one) so tracebacks don't pile up.
+    """
+    def __init__(self, status_code: int, body: bytes, headers: Optional[Dict[str, str]] = None):
+        super().__init__(status_code=status_code, headers=headers)
+        self.body = body
+
+def value_error_to_http(status_code: int, title: str, instance: str,
+                        exception: Type[ValueError] = ValueError) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Translate a ValueError raised by a controller method into an RFC 7807 HTTPException.
+
+    Works on async methods and on plain ones (e.g. those returning a stream), so every
+    representation of an endpoint answers with the same problem body.
+    Stack decorators to map ValueError subclasses separately: the innermost one is checked first.
+
+    Args:
+        status_code: HTTP status to respond with
+        title: Problem title
+        instance: Problem instance, formatted with the method's arguments (e.g. "/clients/{client_id}")
+        exception: ValueError subclass to translate, ValueError itself by default
+    """
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        signature = inspect.signature(fn)
+
+        def to_http(e: ValueError, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> HTTPException:
+            # Arguments are only bound to format the instance once something has failed
+            arguments = signature.bind(*args, **kwargs).arguments
+            return HTTPException(
+                status_code=status_code,
+                detail={
+                    "type": "about:blank",
+                    "title": title,
+                    "status": status_code,
+                    "detail": str(e),
+                    "instance": instance.format(**arguments)
+                }
+            )
+
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+                try:
+                    return await fn(*args, **kwargs)
+                except exception as e:
+                    raise to_http(e, args, kwargs)
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            try:
+                return fn(*args, **kwargs)
+            except exception as e:
+                raise to_http(e, args, kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,28 @@
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+@lru_cache(maxsize=None)
+def _adapter(response_model: Any) -> TypeAdapter:
+    """One TypeAdapter per response type; building its serializer is the costly part."""
+    return TypeAdapter(response_model)
+
+def encode_json(payload: Any, response_model: Any) -> bytes:
+    """
+    Encode a payload to JSON bytes through the serializer of its response model.
+
+    pydantic-core writes the bytes directly, so no intermediate dict is built, while the
+    declared schema still decides which fields are sent and how they are written.
+    """
+    return _adapter(response_model).dump_json(payload)
+
+def json_response(payload: Any, response_model: Any) -> Response:
+    """
+    Send already-validated response models without FastAPI's response_model pass.
+
+    FastAPI would validate the models again and build a dict for a second encoder;
+    the route's response_model is passed here instead so it still shapes the body.
+    """
+    return Response(content=encode_json(payload, response_model), media_type="application/json")
@@ -1,11 +1,22 @@
 from datetime import datetime, timedelta
 from typing import Dict, Any
 from jose import JWTError, jwt
-from fastapi import HTTPException, status
-from ..config import settings
+from fastapi import status
+from ..config import get_settings
+from .http_errors import problem_body, StaticHTTPException
+
+# Fully static, so sent as pre-encoded bytes
+INVALID_TOKEN_BODY = problem_body({
+    "type": "about:blank",
+    "title": "Invalid authentication credentials",
+    "status": 401,
+    "detail": "Could not validate credentials",
+    "instance": "/auth/token"
+})
 
 def create_access_token(data: Dict[str, Any]) -> str:
     """Create a new JWT access token."""
+    settings = get_settings()
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     to_encode.update({"exp": expire})
@@ -19,6 +30,7 @@ def create_access_token(data: Dict[str, Any]) -> str:
 
 def verify_token(token: str) -> Dict[str, Any]:
     """Verify a JWT token and return its payload."""
+    settings = get_settings()
     try:
         payload = jwt.decode(
             token, 
@@ -27,13 +39,4 @@ def verify_token(token: str) -> Dict[str, Any]:
         )
         return payload
     except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "type": "about:blank",
-                "title": "Invalid authentication credentials",
-                "status": 401,
-                "detail": "Could not validate credentials",
-                "instance": "/auth/token"
-            }
-        )
+        raise StaticHTTPException(status.HTTP_401_UNAUTHORIZED, INVALID_TOKEN_BODY)
@@ -0,0 +1,19 @@
+from typing import Any, AsyncIterable, AsyncIterator
+
+import orjson
+from fastapi import Request
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+def wants_ndjson(request: Request) -> bool:
+    """Whether the client asked for newline-delimited JSON instead of a JSON list."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+async def ndjson_lines(items: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+    """
+    Encode DTOs one JSON document per line.
+
+    DTO fields mirror the response models; Decimal is written as a string like in the JSON lists.
+    """
+    async for item in items:
+        yield orjson.dumps(item, default=str) + b"\n"
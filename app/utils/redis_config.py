@@ -0,0 +1,57 @@
+from typing import Iterator, Optional
+from redis.asyncio import ConnectionPool, Redis
+from redis.exceptions import RedisError
+
+
+def get_redis(
+    host: Optional[str],
+    port: int,
+    db: int,
+    password: Optional[str],
+    pool_size: int,
+    socket_timeout: float,
+    health_check_interval: int,
+) -> Iterator[Optional[Redis]]:
+    """Provide a pooled Redis client for the lifetime of the application.
+
+    Yields None when no host is configured so caching can be skipped. The
+    client is built synchronously (it connects lazily) so that providers
+    depending on it stay synchronous; see open_redis and close_redis for
+    the async parts of its lifecycle.
+    """
+    if not host:
+        yield None
+        return
+
+    # One explicit pool per worker: bounded under bursts, and idle sockets
+    # are health-checked before reuse instead of failing the first command
+    pool = ConnectionPool(
+        host=host,
+        port=port,
+        db=db,
+        password=password,
+        max_connections=pool_size,
+        socket_timeout=socket_timeout,
+        health_check_interval=health_check_interval,
+    )
+    yield Redis.from_pool(pool)
+
+
+async def open_redis(client: Optional[Redis], min_idle_conns: int) -> None:
+    """Warm up idle connections so the first requests don't pay the connect cost."""
+    if client is None:
+        return
+
+    pool = client.connection_pool
+    try:
+        connections = [await pool.get_connection("PING") for _ in range(min_idle_conns)]
+        for connection in connections:
+            await pool.release(connection)
+    except RedisError:
+        pass
+
+
+async def close_redis(client: Optional[Redis]) -> None:
+    """Close the client and the connection pool it owns."""
+    if client is not None:
+        await client.aclose()